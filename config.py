@@ -1,14 +1,16 @@
 """
 Configuration Hub for Neko Signal System.
 
-Loads all tunable parameters from a ``.env`` file (via ``python-dotenv``)
-and exposes them as typed, ``Final`` module-level constants. Downstream
-modules must import from here exclusively — never read ``os.environ``
-directly and never hard-code values.
+Loads all tunable parameters from a ``.env`` file (via ``python-dotenv``,
+parsed once into memory — ``os.environ`` is never mutated) and exposes
+them as typed, ``Final`` module-level constants. Downstream modules must
+import from here exclusively — never read ``os.environ`` directly and
+never hard-code values.
 
 Priority (highest → lowest):
     1. Actual environment variables already set in the shell.
-    2. Values declared in the ``.env`` file in the project root.
+    2. Values declared in the ``.env`` file in the project root (or in the
+       ``config_frozen.py`` snapshot, when one has been generated).
     3. The default values defined in this module as fallbacks.
 
 Usage::
@@ -19,31 +21,61 @@ Usage::
 from __future__ import annotations
 
 import os
-from pathlib import Path
-from typing import Final
-
-from dotenv import load_dotenv
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Optional
 
 # ---------------------------------------------------------------------------
-# Bootstrap: load .env from the project root
+# Bootstrap: parse .env from the project root once into memory
 # ---------------------------------------------------------------------------
 
-_ENV_PATH: Path = Path(__file__).resolve().parent / ".env"
-load_dotenv(dotenv_path=_ENV_PATH, override=False)
+# Plain string arithmetic: abspath() is a no-op on the already-absolute
+# ``__file__`` of an imported module, so this costs no stat/readlink calls.
+_ENV_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+try:
+    # Deploy-time snapshot written by ``freeze_config.py`` — skips python-dotenv.
+    from config_frozen import FROZEN_ENV as _ENV  # type: ignore[import-not-found]
+except ImportError:
+    from dotenv import dotenv_values
+
+    # Parsed once at import; keys declared without a value (``FOO``) are dropped.
+    _ENV: dict[str, str] = {  # type: ignore[no-redef]
+        key: value
+        for key, value in dotenv_values(dotenv_path=_ENV_PATH).items()
+        if value is not None
+    }
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers — typed .env readers with fallback defaults
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _raw(key: str) -> Optional[str]:
+    """Resolves ``key`` from the shell environment, then ``.env``.
+
+    Returns:
+        The stripped raw string, or ``None`` if the key is set in neither.
+    """
+    raw: Optional[str] = os.environ.get(key)
+    if raw is None:
+        raw = _ENV.get(key)
+    return raw.strip() if raw is not None else None
+
+
 def _str(key: str, default: str) -> str:
     """Reads a string value from environment, falling back to ``default``."""
-    return os.environ.get(key, default).strip()
+    raw: Optional[str] = _raw(key)
+    return default if raw is None else raw
 
 
 def _int(key: str, default: int) -> int:
     """Reads an integer value from environment, falling back to ``default``."""
-    raw: str = os.environ.get(key, "").strip()
+    raw: Optional[str] = _raw(key)
+    if not raw:
+        return default
     try:
         return int(raw)
     except ValueError:
@@ -52,16 +84,26 @@ def _int(key: str, default: int) -> int:
 
 def _float(key: str, default: float) -> float:
     """Reads a float value from environment, falling back to ``default``."""
-    raw: str = os.environ.get(key, "").strip()
+    raw: Optional[str] = _raw(key)
+    if not raw:
+        return default
     try:
         return float(raw)
     except ValueError:
         return default
 
 
+def _bool(key: str, default: bool) -> bool:
+    """Reads a boolean flag (``1/true/yes/on``) from environment, falling back to ``default``."""
+    raw: Optional[str] = _raw(key)
+    if not raw:
+        return default
+    return raw.lower() in ("1", "true", "yes", "on")
+
+
 def _str_list(key: str, default: list[str]) -> list[str]:
     """Reads a comma-separated string from environment into a list."""
-    raw: str = os.environ.get(key, "").strip()
+    raw: Optional[str] = _raw(key)
     if not raw:
         return default
     return [item.strip() for item in raw.split(",") if item.strip()]
@@ -91,9 +133,10 @@ TRADING_PAIRS: Final[list[str]] = _str_list(
 
 # Human-readable display names derived from the symbol list.
 # Maps "BTC/USDT:USDT" → "BTCUSDT" by stripping everything after the first "/".
-PAIR_DISPLAY_NAMES: Final[dict[str, str]] = {
-    sym: sym.split("/")[0] + "USDT" for sym in TRADING_PAIRS
-}
+# Read-only view: downstream modules must never mutate shared config.
+PAIR_DISPLAY_NAMES: Final[Mapping[str, str]] = MappingProxyType({
+    sym: sym.partition("/")[0] + "USDT" for sym in TRADING_PAIRS
+})
 
 # ---------------------------------------------------------------------------
 # Exchange Configuration
@@ -144,6 +187,8 @@ ATR_PERIOD: Final[int] = _int("ATR_PERIOD", 14)
 
 VP_BINS: Final[int] = _int("VP_BINS", 30)
 HVN_PERCENTILE: Final[float] = _float("HVN_PERCENTILE", 75.0)
+# Candles sampled by the risk manager's profile; defaults to the full fetch.
+VP_WINDOW: Final[int] = _int("VP_WINDOW", OHLCV_LIMIT)
 
 # ---------------------------------------------------------------------------
 # CVD / OFI Rolling Windows
@@ -183,10 +228,12 @@ INFLUXDB_BUCKET: Final[str] = _str("INFLUXDB_BUCKET", "neko_signal")
 
 WEBHOOK_URL: Final[str] = _str("WEBHOOK_URL", "https://hooks.example.com/neko-signal")
 WEBHOOK_TIMEOUT_S: Final[float] = _float("WEBHOOK_TIMEOUT_S", 10.0)
-WEBHOOK_HEADERS: Final[dict[str, str]] = {
+# Indented JSON bodies for humans debugging a webhook; compact otherwise.
+WEBHOOK_PRETTY: Final[bool] = _bool("WEBHOOK_PRETTY", False)
+WEBHOOK_HEADERS: Final[Mapping[str, str]] = MappingProxyType({
     "Content-Type": "application/json",
     "User-Agent": "NekoSignal/1.0",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Main Scan Loop
@@ -7,6 +7,8 @@ taker-volume columns, and L2 orderbook snapshots, via ccxt's async support.
 Key design choices:
     - Uses Binance's raw kline API (fapiPublicGetKlines) to guarantee access
       to taker_buy_base_volume, which ccxt's generic fetch_ohlcv may strip.
+    - ccxt decodes REST bodies with ``orjson`` whenever it is importable (it is
+      pinned in ``requirements.txt``), so no JSON-parser patching is needed here.
     - Retry logic with exponential back-off isolates transient network issues.
     - Returns typed DataFrames with a consistent schema for downstream modules.
 """
@@ -15,7 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional
 
 import ccxt.async_support as ccxt
 import numpy as np
@@ -51,6 +53,126 @@ try:
 except ImportError:
     from typing_extensions import Final  # type: ignore[assignment]
 
+# Positions of [open, high, low, close, volume, taker_buy_base] within a raw
+# 12-element Binance kline row (see ``_fetch_raw_klines``).
+_KLINE_NUMERIC_COLS: Final[list[int]] = [1, 2, 3, 4, 5, 9]
+
+# Linear back-off schedule, one delay per attempt: RETRY_DELAY_S × attempt.
+_BACKOFF_S: Final[tuple[float, ...]] = tuple(
+    RETRY_DELAY_S * attempt for attempt in range(1, MAX_RETRIES + 1)
+)
+
+
+# ---------------------------------------------------------------------------
+# Struct-of-Arrays Candle View
+# ---------------------------------------------------------------------------
+
+class Candles(NamedTuple):
+    """Struct-of-arrays view of an OHLCV frame — one float64 ndarray per column.
+
+    Hot-path consumers (e.g. Gate 2) read scalars straight off these arrays
+    instead of going through pandas indexers. Because this is a tuple of
+    eight arrays, use ``size`` (not ``len()``) for the candle count.
+
+    Attributes:
+        ts: Candle open times as int64 nanoseconds since epoch (UTC).
+        open, high, low, close, volume: Price / volume columns.
+        taker_buy: Taker buy base-asset volume.
+        taker_sell: Derived: ``volume - taker_buy``.
+    """
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    taker_buy: np.ndarray
+    taker_sell: np.ndarray
+
+    @property
+    def size(self) -> int:
+        """Number of candles."""
+        return int(self.close.shape[0])
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> Candles:
+        """Builds a view from a DataFrame in the ``OHLCV_COLUMNS`` schema.
+
+        Args:
+            df: OHLCV DataFrame; a ``DatetimeIndex`` is converted to int64 ns,
+                any other index is taken as-is.
+
+        Returns:
+            ``Candles`` whose arrays share memory with ``df`` where possible.
+        """
+        index = df.index
+        ts: np.ndarray = (
+            index.as_unit("ns").asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()
+        )
+        return cls(
+            ts,
+            *(df[col].to_numpy(dtype=np.float64) for col in OHLCV_COLUMNS),
+        )
+
+    def tail(self, n: int) -> Candles:
+        """Returns a view of the last ``n`` candles (no copy)."""
+        return Candles(*(col[-n:] for col in self))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialises the ``OHLCV_COLUMNS`` DataFrame indexed by UTC timestamp."""
+        return pd.DataFrame(
+            dict(zip(OHLCV_COLUMNS, self[1:])),
+            index=pd.DatetimeIndex(self.ts, tz="UTC", name="timestamp"),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Struct-of-Arrays Orderbook View
+# ---------------------------------------------------------------------------
+
+def _level_columns(levels: list) -> tuple[np.ndarray, np.ndarray]:
+    """Splits ``[[price, size, ...], ...]`` into contiguous price / size arrays.
+
+    Malformed or empty input yields two empty arrays.
+    """
+    arr: np.ndarray = np.asarray(levels, dtype=np.float64) if levels else np.empty((0, 2))
+    if arr.ndim != 2 or arr.shape[1] < 2:
+        arr = np.empty((0, 2))
+    rows: np.ndarray = np.ascontiguousarray(arr[:, :2].T)
+    return rows[0], rows[1]
+
+
+class OrderBook(NamedTuple):
+    """Struct-of-arrays L2 snapshot — one float64 ndarray per side and field.
+
+    Built once at ingestion so scorers never walk the exchange's nested
+    lists. Level order is preserved from the exchange.
+
+    Attributes:
+        bid_prices, bid_sizes: Bid levels, sorted descending by price.
+        ask_prices, ask_sizes: Ask levels, sorted ascending by price.
+        timestamp: Exchange timestamp in ms (may be ``None``).
+    """
+    bid_prices: np.ndarray
+    bid_sizes: np.ndarray
+    ask_prices: np.ndarray
+    ask_sizes: np.ndarray
+    timestamp: Optional[int] = None
+
+    @classmethod
+    def from_levels(cls, bids: list, asks: list, timestamp: Optional[int] = None) -> OrderBook:
+        """Builds the arrays from ccxt-style ``[[price, size], ...]`` level lists.
+
+        Args:
+            bids: Bid levels, best (highest) first.
+            asks: Ask levels, best (lowest) first.
+            timestamp: Exchange timestamp in ms, if known.
+
+        Returns:
+            ``OrderBook`` with one contiguous array per column.
+        """
+        return cls(*_level_columns(bids), *_level_columns(asks), timestamp)
+
 
 # ---------------------------------------------------------------------------
 # Exchange Factory
@@ -141,7 +263,9 @@ async def fetch_extended_ohlcv(
         ``[open, high, low, close, volume, taker_buy_volume, taker_sell_volume]``
         Returns ``None`` if all retry attempts fail.
     """
-    await exchange.load_markets()
+    if not exchange.markets:
+        # One-shot: later calls on the same instance reuse the loaded metadata.
+        await exchange.load_markets()
     market: dict = exchange.market(symbol)
     market_id: str = market["id"]                            # e.g. "BTCUSDT"
     interval: str = exchange.timeframes.get(timeframe, "1m")  # e.g. "1m"
@@ -154,7 +278,7 @@ async def fetch_extended_ohlcv(
 
             if not raw:
                 logger.warning("[%s] Empty kline response (attempt %d).", symbol, attempt)
-                await asyncio.sleep(RETRY_DELAY_S * attempt)
+                await asyncio.sleep(_BACKOFF_S[attempt - 1])
                 continue
 
             df = _parse_binance_klines(raw, symbol)
@@ -169,7 +293,7 @@ async def fetch_extended_ohlcv(
                 "[%s] Network error attempt %d/%d: %s", symbol, attempt, MAX_RETRIES, exc
             )
             if attempt < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY_S * attempt)
+                await asyncio.sleep(_BACKOFF_S[attempt - 1])
         except ccxt.ExchangeError as exc:
             logger.error("[%s] Exchange error: %s — falling back to generic fetch.", symbol, exc)
             return await _fallback_fetch_ohlcv(exchange, symbol, timeframe, limit)
@@ -180,6 +304,45 @@ async def fetch_extended_ohlcv(
     return None
 
 
+async def fetch_extended_ohlcv_batch(
+    exchange: ccxt.Exchange,
+    symbols: list[str],
+    timeframe: str = PRIMARY_TIMEFRAME,
+    limit: int = OHLCV_LIMIT,
+) -> dict[str, Optional[pd.DataFrame]]:
+    """Fetches extended OHLCV for several symbols concurrently on one exchange.
+
+    Market metadata is loaded once up front, then every symbol's
+    ``fetch_extended_ohlcv`` call is dispatched via ``asyncio.gather``.
+    A failure in one symbol never affects the others.
+
+    Args:
+        exchange: An initialized ccxt async binanceusdm exchange instance.
+        symbols: Trading symbols in ccxt format.
+        timeframe: Candle timeframe string accepted by ccxt, e.g. ``"1m"``.
+        limit: Number of candles to retrieve per symbol.
+
+    Returns:
+        Dict mapping each symbol to its DataFrame, or ``None`` if it failed.
+    """
+    if not exchange.markets:
+        await exchange.load_markets()
+
+    results = await asyncio.gather(
+        *[fetch_extended_ohlcv(exchange, sym, timeframe, limit) for sym in symbols],
+        return_exceptions=True,
+    )
+
+    frames: dict[str, Optional[pd.DataFrame]] = {}
+    for sym, result in zip(symbols, results):
+        if isinstance(result, BaseException):
+            logger.error("[%s] Batch kline fetch raised: %s", sym, result)
+            frames[sym] = None
+        else:
+            frames[sym] = result
+    return frames
+
+
 def _parse_binance_klines(raw: list[list], symbol: str) -> Optional[pd.DataFrame]:
     """Parses Binance's raw 12-column kline response into a typed DataFrame.
 
@@ -194,30 +357,28 @@ def _parse_binance_klines(raw: list[list], symbol: str) -> Optional[pd.DataFrame
         logger.warning("[%s] Kline response has fewer than 10 columns.", symbol)
         return None
 
-    df = pd.DataFrame(
-        raw,
-        columns=[
-            "timestamp", "open", "high", "low", "close", "volume",
-            "close_time", "quote_volume", "trade_count",
-            "taker_buy_base_volume", "taker_buy_quote_volume", "ignore",
-        ],
+    # One object → ndarray walk; numeric columns are then cast as a single
+    # float64 block: [open, high, low, close, volume, taker_buy_base].
+    arr: np.ndarray = np.asarray(raw)
+    nums: np.ndarray = arr[:, _KLINE_NUMERIC_COLS].astype(np.float64)
+
+    # Open times are read straight off the raw rows as int64 ms, then scaled
+    # to ns — no object-column coercion and no to_datetime unit inference.
+    open_ms: np.ndarray = np.fromiter((row[0] for row in raw), dtype=np.int64, count=len(raw))
+    volume: np.ndarray = nums[:, 4]
+    taker_buy: np.ndarray = nums[:, 5]
+
+    candles: Candles = Candles(
+        ts=open_ms * 1_000_000,
+        open=nums[:, 0],
+        high=nums[:, 1],
+        low=nums[:, 2],
+        close=nums[:, 3],
+        volume=volume,
+        taker_buy=taker_buy,
+        taker_sell=volume - taker_buy,
     )
-
-    df["timestamp"] = pd.to_datetime(
-        df["timestamp"].astype(np.int64), unit="ms", utc=True
-    )
-    df.set_index("timestamp", inplace=True)
-
-    numeric_cols: list[str] = [
-        "open", "high", "low", "close", "volume", "taker_buy_base_volume"
-    ]
-    df[numeric_cols] = df[numeric_cols].astype(np.float64)
-
-    df["taker_buy_volume"] = df["taker_buy_base_volume"]
-    df["taker_sell_volume"] = df["volume"] - df["taker_buy_volume"]
-
-    return df[["open", "high", "low", "close", "volume",
-               "taker_buy_volume", "taker_sell_volume"]].copy()
+    return candles.to_dataframe()
 
 
 async def _fallback_fetch_ohlcv(
@@ -246,23 +407,32 @@ async def _fallback_fetch_ohlcv(
         if not raw:
             return None
 
-        df = pd.DataFrame(
-            raw, columns=["timestamp", "open", "high", "low", "close", "volume"]
+        # ccxt rows are already numeric: [timestamp, open, high, low, close, volume]
+        arr: np.ndarray = np.asarray(raw, dtype=np.float64)
+        index: pd.DatetimeIndex = pd.DatetimeIndex(
+            arr[:, 0].astype(np.int64) * 1_000_000, tz="UTC", name="timestamp"
         )
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df.set_index("timestamp", inplace=True)
-        df = df.astype(np.float64)
 
         # 50/50 split — intentionally triggers Gate 2 anti-wash filter
-        df["taker_buy_volume"] = df["volume"] * 0.5
-        df["taker_sell_volume"] = df["volume"] * 0.5
+        half_volume: np.ndarray = arr[:, 5] * 0.5
+        df = pd.DataFrame(
+            {
+                "open": arr[:, 1],
+                "high": arr[:, 2],
+                "low": arr[:, 3],
+                "close": arr[:, 4],
+                "volume": arr[:, 5],
+                "taker_buy_volume": half_volume,
+                "taker_sell_volume": half_volume,
+            },
+            index=index,
+        )
         logger.warning(
             "[%s] Fallback OHLCV used. Taker volumes estimated (50/50). "
             "Gate 2 will likely reject this candle.",
             symbol,
         )
-        return df[["open", "high", "low", "close", "volume",
-                   "taker_buy_volume", "taker_sell_volume"]].copy()
+        return df
     except Exception as exc:  # noqa: BLE001
         logger.exception("[%s] Fallback OHLCV also failed: %s", symbol, exc)
         return None
@@ -276,7 +446,7 @@ async def fetch_orderbook(
     exchange: ccxt.Exchange,
     symbol: str,
     depth: int = ORDERBOOK_DEPTH,
-) -> Optional[dict]:
+) -> Optional[OrderBook]:
     """Fetches an L2 orderbook snapshot for a given symbol.
 
     Args:
@@ -285,29 +455,60 @@ async def fetch_orderbook(
         depth: Number of price levels to retrieve on each side.
 
     Returns:
-        A dict with keys:
-            - ``"bids"``: list of ``[price, size]`` sorted descending.
-            - ``"asks"``: list of ``[price, size]`` sorted ascending.
-            - ``"timestamp"``: exchange timestamp in ms (may be ``None``).
-        Returns ``None`` if all retry attempts fail.
+        An :class:`OrderBook` (bids descending, asks ascending by price),
+        or ``None`` if all retry attempts fail.
     """
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             ob: dict = await exchange.fetch_order_book(symbol, limit=depth)
-            return {
-                "bids": ob.get("bids", []),
-                "asks": ob.get("asks", []),
-                "timestamp": ob.get("timestamp"),
-            }
+            return OrderBook.from_levels(
+                ob.get("bids") or [], ob.get("asks") or [], ob.get("timestamp")
+            )
         except (ccxt.NetworkError, ccxt.RequestTimeout) as exc:
             logger.warning(
                 "[%s] Orderbook network error attempt %d/%d: %s",
                 symbol, attempt, MAX_RETRIES, exc,
             )
             if attempt < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY_S * attempt)
+                await asyncio.sleep(_BACKOFF_S[attempt - 1])
         except Exception as exc:  # noqa: BLE001
             logger.exception("[%s] Unexpected orderbook error: %s", symbol, exc)
             return None
 
     return None
+
+
+# ---------------------------------------------------------------------------
+# Public: Last Price Fetcher
+# ---------------------------------------------------------------------------
+
+async def fetch_last_price(exchange: ccxt.Exchange, symbol: str) -> Optional[float]:
+    """Fetches the last traded price from the ticker endpoint.
+
+    Far cheaper than a full OHLCV fetch; used to check TP/SL on pairs that
+    already hold an open position.
+
+    Args:
+        exchange: An initialized ccxt async exchange instance.
+        symbol: Trading symbol in ccxt format, e.g. ``"BTC/USDT:USDT"``.
+
+    Returns:
+        The last price as a float, or ``None`` if unavailable after retries.
+    """
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            ticker: dict = await exchange.fetch_ticker(symbol)
+            last = ticker.get("last")
+            return float(last) if last is not None else None
+        except (ccxt.NetworkError, ccxt.RequestTimeout) as exc:
+            logger.warning(
+                "[%s] Ticker network error attempt %d/%d: %s",
+                symbol, attempt, MAX_RETRIES, exc,
+            )
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(_BACKOFF_S[attempt - 1])
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("[%s] Unexpected ticker error: %s", symbol, exc)
+            return None
+
+    return None
@@ -0,0 +1,73 @@
+"""
+Config Freezer for Neko Signal System.
+
+Snapshots the project's ``.env`` file into ``config_frozen.py`` — a plain
+Python module holding the parsed key/value pairs as literals. When that module
+is present, ``config.py`` imports it instead of parsing ``.env`` through
+``python-dotenv``, so process start-up only pays for loading bytecode.
+
+Shell environment variables still take precedence over the snapshot at run
+time, exactly as they do over ``.env``. Re-run this tool after every ``.env``
+change; delete ``config_frozen.py`` to return to live parsing.
+
+Run (at deploy time):
+    python freeze_config.py && python -m compileall -q .
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Final
+
+from dotenv import dotenv_values
+
+_ROOT: Final[Path] = Path(__file__).resolve().parent
+ENV_PATH: Final[Path] = _ROOT / ".env"
+FROZEN_PATH: Final[Path] = _ROOT / "config_frozen.py"
+
+
+def render_frozen_module(env: dict[str, str]) -> str:
+    """Renders the source of ``config_frozen.py`` for the given key/value pairs.
+
+    Args:
+        env: Parsed ``.env`` mapping (keys without a value already removed).
+
+    Returns:
+        Python source text defining a single ``FROZEN_ENV`` dict literal.
+    """
+    stamp: str = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    body: str = "".join(f"    {key!r}: {value!r},\n" for key, value in sorted(env.items()))
+    return (
+        '"""\n'
+        "Frozen ``.env`` snapshot for Neko Signal System.\n\n"
+        f"AUTO-GENERATED by ``freeze_config.py`` at {stamp} — do not edit.\n"
+        "Delete this file to return to live ``.env`` parsing.\n"
+        '"""\n\n'
+        "from typing import Final\n\n"
+        f"FROZEN_ENV: Final[dict[str, str]] = {{\n{body}}}\n"
+    )
+
+
+def freeze(env_path: Path = ENV_PATH, out_path: Path = FROZEN_PATH) -> int:
+    """Parses ``env_path`` and writes the frozen snapshot to ``out_path``.
+
+    Args:
+        env_path: Source ``.env`` file. A missing file yields an empty snapshot.
+        out_path: Destination module path.
+
+    Returns:
+        The number of keys written.
+    """
+    env: dict[str, str] = {
+        key: value
+        for key, value in dotenv_values(dotenv_path=env_path).items()
+        if value is not None
+    }
+    out_path.write_text(render_frozen_module(env), encoding="utf-8")
+    return len(env)
+
+
+if __name__ == "__main__":
+    count: int = freeze()
+    print(f"Wrote {count} keys from {ENV_PATH.name} → {FROZEN_PATH.name}")
@@ -11,13 +11,19 @@ manipulated market conditions:
         Three fully-vectorised sub-filters detect low-quality candles caused
         by wash trades, algos printing synthetic volume, or dead-market chop.
 
-Both gates are stateless pure functions and can be unit-tested in isolation.
+Both gates are pure functions and can be unit-tested in isolation. Gate 2
+keeps a per-symbol ATR memo so that consecutive scans advance the ATR by one
+True Range step instead of recomputing it over the whole frame; results are
+identical to a full recompute.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Final, Optional
 
 import numpy as np
 import pandas as pd
@@ -31,6 +37,13 @@ from config import (
     WASH_TRADE_TAKER_RATIO_HIGH,
     WASH_TRADE_TAKER_RATIO_LOW,
 )
+from data_ingestion import Candles
+
+# Optional JIT accelerator for the ATR kernel; NumPy path is used without it.
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +52,105 @@ logger = logging.getLogger(__name__)
 # Shared Vectorized Helper
 # ---------------------------------------------------------------------------
 
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Trailing ``period``-sample mean via a single cumulative sum.
+
+    Args:
+        values: 1-D float64 array with no NaNs.
+        period: Window size.
+
+    Returns:
+        Array aligned to ``values``; the first ``period - 1`` entries are ``NaN``.
+    """
+    out: np.ndarray = np.full(values.size, np.nan, dtype=np.float64)
+    if values.size >= period:
+        csum: np.ndarray = np.cumsum(values)
+        out[period - 1:] = csum[period - 1:]
+        out[period:] -= csum[:-period]
+        out[period - 1:] /= period
+    return out
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Computes per-candle True Range as a float64 ndarray.
+
+    Args:
+        high: Candle highs.
+        low: Candle lows.
+        close: Candle closes.
+
+    Returns:
+        ``np.ndarray`` of True Range values aligned to the inputs.
+    """
+    # The first candle has no previous close; seeding it with its own close
+    # keeps both gap terms ≤ High - Low, so TR[0] reduces to the bar range.
+    prev_close: np.ndarray = np.empty_like(close)
+    prev_close[:1] = close[:1]
+    prev_close[1:] = close[:-1]
+
+    return np.maximum.reduce(
+        [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+    )
+
+
+def _tr_atr_loop(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Single streaming pass producing True Range and its ``period`` SMA.
+
+    Scalar loop intended for JIT compilation (see ``_tr_atr_jit``); semantics
+    match ``_true_range`` + ``_rolling_mean`` exactly.
+    """
+    n: int = high.shape[0]
+    tr: np.ndarray = np.empty(n, dtype=np.float64)
+    atr: np.ndarray = np.full(n, np.nan, dtype=np.float64)
+    window_sum: float = 0.0
+    for i in range(n):
+        prev_close = close[i - 1] if i > 0 else close[0]
+        tr[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        window_sum += tr[i]
+        if i >= period:
+            window_sum -= tr[i - period]
+        if i >= period - 1:
+            atr[i] = window_sum / period
+    return tr, atr
+
+
+# Optional accelerator: JIT-compile the streaming kernel when numba is present.
+if njit is not None:
+    _tr_atr_jit = njit(cache=True)(_tr_atr_loop)
+    # Compile (or load from cache) at import, not on the first live scan.
+    # Candle columns are read-only, so warm the read-only signature.
+    _warm: np.ndarray = np.ones(30, dtype=np.float64)
+    _warm.setflags(write=False)
+    _tr_atr_jit(_warm, _warm, _warm, 14)
+    del _warm
+else:
+    _tr_atr_jit = None
+
+
+def _tr_and_atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = ATR_PERIOD
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns ``(true_range, atr)`` ndarrays, via numba when available.
+
+    Args:
+        high: Candle highs (float64).
+        low: Candle lows (float64).
+        close: Candle closes (float64).
+        period: Rolling window size for the ATR calculation.
+
+    Returns:
+        Two float64 arrays aligned to the inputs; ATR warm-up rows are ``NaN``.
+    """
+    if _tr_atr_jit is not None:
+        return _tr_atr_jit(high, low, close, period)
+    tr: np.ndarray = _true_range(high, low, close)
+    return tr, _rolling_mean(tr, period)
+
+
 def compute_atr(df: pd.DataFrame, period: int = ATR_PERIOD) -> pd.Series:
-    """Computes Average True Range (ATR) using vectorized Pandas operations.
+    """Computes Average True Range (ATR) in one pass (numba) or via NumPy.
 
     ATR is the rolling mean of True Range:
         TR = max(High - Low, |High - Prev_Close|, |Low - Prev_Close|)
@@ -53,22 +163,104 @@ def compute_atr(df: pd.DataFrame, period: int = ATR_PERIOD) -> pd.Series:
         A ``pd.Series`` of ATR values aligned to ``df.index``.
         Early rows where insufficient data exists will be ``NaN``.
     """
-    prev_close: pd.Series = df["close"].shift(1)
-    tr: pd.Series = pd.concat(
-        [
-            df["high"] - df["low"],
-            (df["high"] - prev_close).abs(),
-            (df["low"] - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-    return tr.rolling(period, min_periods=period).mean()
+    _, atr = _tr_and_atr(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+    return pd.Series(atr, index=df.index)
+
+
+# ---------------------------------------------------------------------------
+# Per-Symbol ATR Memo (Gate 2)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _AtrState:
+    """Rolling windows behind the ATR / ATR-MA of a symbol's last completed candle.
+
+    Attributes:
+        last_ts:  Timestamp (``Candles.ts``) of the completed candle the windows end on.
+        last_close: Close of that candle (previous close for the next TR).
+        tr_win:   Last ``ATR_PERIOD`` True Range values.
+        atr_win:  Last ``ATR_MA_PERIOD`` ATR values.
+    """
+    last_ts: int
+    last_close: float
+    tr_win: deque[float]
+    atr_win: deque[float]
+
+    @property
+    def atr(self) -> float:
+        return sum(self.tr_win) / len(self.tr_win)
+
+    @property
+    def atr_ma(self) -> float:
+        return sum(self.atr_win) / len(self.atr_win)
+
+
+# Keyed by symbol. Consecutive scans one candle apart only need one TR step.
+# Process-local by design: the scanner is a single asyncio process and every
+# fetch returns the full warm-up history, so a cold cache costs one tail pass.
+_ATR_CACHE: dict[str, _AtrState] = {}
+
+
+def _completed_atr_and_ma(candles: Candles, symbol: str) -> tuple[float, float]:
+    """Returns ``(ATR, ATR_MA)`` at the last completed candle (index ``-2``).
+
+    With a ``symbol``, the result is memoised: a repeat scan of the same
+    completed candle is a lookup, and a scan exactly one candle later advances
+    the cached windows by a single True Range step. Any other shape of change
+    (gaps, a different history) falls back to a full vectorised recompute.
+
+    Args:
+        candles: Candle arrays with at least ``ATR_MA_PERIOD + ATR_PERIOD + 2``
+            rows.
+        symbol: Cache key; empty disables memoisation.
+
+    Returns:
+        ``(latest_atr, latest_atr_ma)``; either may be ``NaN`` during warm-up.
+    """
+    state: Optional[_AtrState] = _ATR_CACHE.get(symbol) if symbol else None
+    completed_ts: int = int(candles.ts[-2])
+
+    if state is not None:
+        if state.last_ts == completed_ts:
+            return state.atr, state.atr_ma
+        if state.last_ts == candles.ts[-3]:
+            high: float = float(candles.high[-2])
+            low: float = float(candles.low[-2])
+            tr: float = max(high - low, abs(high - state.last_close), abs(low - state.last_close))
+            state.tr_win.append(tr)
+            state.atr_win.append(state.atr)
+            state.last_ts = completed_ts
+            state.last_close = float(candles.close[-2])
+            return state.atr, state.atr_ma
+
+    tr_all, atr_all = _tr_and_atr(candles.high, candles.low, candles.close, ATR_PERIOD)
+    atr_ma_all: np.ndarray = _rolling_mean(atr_all[ATR_PERIOD - 1:], ATR_MA_PERIOD)
+    latest_atr: float = float(atr_all[-2])
+    latest_atr_ma: float = float(atr_ma_all[-2]) if atr_ma_all.size >= 2 else float("nan")
+
+    if symbol and not (np.isnan(latest_atr) or np.isnan(latest_atr_ma)):
+        _ATR_CACHE[symbol] = _AtrState(
+            last_ts=completed_ts,
+            last_close=float(candles.close[-2]),
+            tr_win=deque(tr_all[-ATR_PERIOD - 1:-1].tolist(), maxlen=ATR_PERIOD),
+            atr_win=deque(atr_all[-ATR_MA_PERIOD - 1:-1].tolist(), maxlen=ATR_MA_PERIOD),
+        )
+    return latest_atr, latest_atr_ma
 
 
 # ---------------------------------------------------------------------------
 # Gate 1: Session Killzone
 # ---------------------------------------------------------------------------
 
+# Active UTC hours, precomputed once; a set also allows non-contiguous windows.
+_SESSION_HOURS: Final[frozenset[int]] = frozenset(range(SESSION_START_UTC, SESSION_END_UTC))
+
+
 def gate_session_killzone(utc_now: datetime | None = None) -> bool:
     """Gate 1: Passes only when the current UTC time is within the Killzone.
 
@@ -93,19 +285,20 @@ def gate_session_killzone(utc_now: datetime | None = None) -> bool:
         utc_now = datetime.now(timezone.utc)
 
     hour: int = utc_now.hour
-    in_session: bool = SESSION_START_UTC <= hour < SESSION_END_UTC
-
-    if not in_session:
-        logger.debug(
-            "Gate 1 FAIL | UTC hour %02d is outside Killzone [%02d:00, %02d:00).",
-            hour,
-            SESSION_START_UTC,
-            SESSION_END_UTC,
-        )
-    else:
-        logger.debug(
-            "Gate 1 PASS | UTC hour %02d is within Killzone.", hour
-        )
+    in_session: bool = hour in _SESSION_HOURS
+
+    if logger.isEnabledFor(logging.DEBUG):
+        if not in_session:
+            logger.debug(
+                "Gate 1 FAIL | UTC hour %02d is outside Killzone [%02d:00, %02d:00).",
+                hour,
+                SESSION_START_UTC,
+                SESSION_END_UTC,
+            )
+        else:
+            logger.debug(
+                "Gate 1 PASS | UTC hour %02d is within Killzone.", hour
+            )
 
     return in_session
 
@@ -114,11 +307,13 @@ def gate_session_killzone(utc_now: datetime | None = None) -> bool:
 # Gate 2: Anti-Wash Trading
 # ---------------------------------------------------------------------------
 
-def gate_anti_wash_trading(df: pd.DataFrame, symbol: str = "") -> bool:
+def gate_anti_wash_trading(df: pd.DataFrame | Candles, symbol: str = "") -> bool:
     """Gate 2: Rejects candles that exhibit wash-trading or synthetic-volume signatures.
 
     Applies three independent sub-filters against the last *completed* candle
-    (``df.iloc[-2]`` avoids reacting to an incomplete live candle):
+    (``df.iloc[-2]`` avoids reacting to an incomplete live candle). They run
+    cheapest-first — 1, 3, then 2 — so the ATR pass is skipped whenever a
+    scalar check already rejects the candle:
 
     **Sub-filter 1 — Volume Efficiency**
         ``|Close - Open| / Volume`` must exceed ``MIN_VOLUME_EFFICIENCY``.
@@ -138,7 +333,8 @@ def gate_anti_wash_trading(df: pd.DataFrame, symbol: str = "") -> bool:
 
     Args:
         df: DataFrame with columns
-            ``[open, high, low, close, volume, taker_buy_volume]``.
+            ``[open, high, low, close, volume, taker_buy_volume]``, or the
+            equivalent ``Candles`` arrays (used as-is, with no conversion).
             Minimum required rows: ``ATR_MA_PERIOD + ATR_PERIOD + 2``.
         symbol: Optional trading symbol used for log tagging (e.g. ``"BTC/USDT:USDT"``).
 
@@ -148,27 +344,36 @@ def gate_anti_wash_trading(df: pd.DataFrame, symbol: str = "") -> bool:
     """
     _tag: str = f"[{symbol.split('/')[0]}] " if symbol else ""
     min_required: int = ATR_MA_PERIOD + ATR_PERIOD + 2
-    if df.empty or len(df) < min_required:
+    n_rows: int = df.size if isinstance(df, Candles) else len(df)
+    if n_rows < min_required:
         logger.warning(
             "Gate 2 SKIP | Insufficient rows: %d < %d required.",
-            len(df),
+            n_rows,
             min_required,
         )
         return False
 
-    # Use the last *completed* candle (index -2) to avoid reacting to a
-    # candle that is still forming in real time.
-    candle: pd.Series = df.iloc[-2]
+    # Only the trailing warm-up window can influence the result, so every
+    # sub-filter works on these column arrays. Scalars for the last
+    # *completed* candle (index -2, avoiding the candle still forming in real
+    # time) are plain ndarray reads instead of boxed pd.Series lookups.
+    tail: Candles = (
+        df.tail(min_required) if isinstance(df, Candles)
+        else Candles.from_frame(df.iloc[-min_required:])
+    )
+    open_: float = float(tail.open[-2])
+    close: float = float(tail.close[-2])
+    total_volume: float = float(tail.volume[-2])
+    taker_buy: float = float(tail.taker_buy[-2])
 
     # ------------------------------------------------------------------ #
     # Sub-filter 1: Volume Efficiency                                      #
     # ------------------------------------------------------------------ #
-    total_volume: float = candle["volume"]
     if total_volume <= 0.0:
         logger.debug("Gate 2 FAIL | Zero volume detected.")
         return False
 
-    price_displacement: float = abs(float(candle["close"]) - float(candle["open"]))
+    price_displacement: float = abs(close - open_)
     volume_efficiency: float = price_displacement / total_volume
 
     if volume_efficiency < MIN_VOLUME_EFFICIENCY:
@@ -179,15 +384,21 @@ def gate_anti_wash_trading(df: pd.DataFrame, symbol: str = "") -> bool:
         return False
 
     # ------------------------------------------------------------------ #
-    # Sub-filter 2: ATR Trend (fully vectorised over entire df)            #
+    # Sub-filter 3: Taker Buy Ratio                                        #
     # ------------------------------------------------------------------ #
-    atr_series: pd.Series = compute_atr(df, period=ATR_PERIOD)
-    atr_ma_series: pd.Series = atr_series.rolling(
-        ATR_MA_PERIOD, min_periods=ATR_MA_PERIOD
-    ).mean()
+    taker_ratio: float = taker_buy / total_volume
 
-    latest_atr: float = float(atr_series.iloc[-2])
-    latest_atr_ma: float = float(atr_ma_series.iloc[-2])
+    if WASH_TRADE_TAKER_RATIO_LOW <= taker_ratio <= WASH_TRADE_TAKER_RATIO_HIGH:
+        logger.info(
+            "%sGate 2 FAIL | Balanced taker ratio: %.4f in [%.2f, %.2f].",
+            _tag, taker_ratio, WASH_TRADE_TAKER_RATIO_LOW, WASH_TRADE_TAKER_RATIO_HIGH,
+        )
+        return False
+
+    # ------------------------------------------------------------------ #
+    # Sub-filter 2: ATR Trend (memoised per symbol, tail-only on a miss)   #
+    # ------------------------------------------------------------------ #
+    latest_atr, latest_atr_ma = _completed_atr_and_ma(tail, symbol)
 
     if np.isnan(latest_atr) or np.isnan(latest_atr_ma):
         logger.debug(
@@ -202,19 +413,6 @@ def gate_anti_wash_trading(df: pd.DataFrame, symbol: str = "") -> bool:
         )
         return False
 
-    # ------------------------------------------------------------------ #
-    # Sub-filter 3: Taker Buy Ratio                                        #
-    # ------------------------------------------------------------------ #
-    taker_buy: float = float(candle["taker_buy_volume"])
-    taker_ratio: float = taker_buy / total_volume
-
-    if WASH_TRADE_TAKER_RATIO_LOW <= taker_ratio <= WASH_TRADE_TAKER_RATIO_HIGH:
-        logger.info(
-            "%sGate 2 FAIL | Balanced taker ratio: %.4f in [%.2f, %.2f].",
-            _tag, taker_ratio, WASH_TRADE_TAKER_RATIO_LOW, WASH_TRADE_TAKER_RATIO_HIGH,
-        )
-        return False
-
     logger.info(
         "%sGate 2 PASS | Efficiency=%.6f | ATR=%.5f/%.5f | TakerRatio=%.4f.",
         _tag, volume_efficiency, latest_atr, latest_atr_ma, taker_ratio,
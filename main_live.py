@@ -7,21 +7,22 @@ continuous, fault-tolerant scanning loop.
 Pipeline (per pair, per cycle):
     ┌─────────────────────────────────────────────────┐
     │  1. Gate 1 — Session Killzone (UTC check)        │
-    │  2. Data Fetch — OHLCV + L2 Orderbook            │
-    │  3. Gate 2 — Anti-Wash Trading filter            │
-    │  4. State Update — resolve TP/SL on open trades  │
-    │  5. Skip if pair already has an open position    │
-    │  6. Scoring Engine — compute directional score   │
-    │  7. Threshold check — score ≥ +4 or ≤ -4?       │
-    │  8. Risk Manager — validate TP/SL and RR         │
-    │  9. State Manager — lock the pair                │
-    │ 10. Notifier — POST signal to webhook            │
-    │ 11. Metrics Exporter — write to InfluxDB         │
+    │  2. Open position? Ticker-only TP/SL check, stop │
+    │  3. Data Fetch — OHLCV + L2 Orderbook            │
+    │  4. Gate 2 — Anti-Wash Trading filter            │
+    │  5. Scoring Engine — compute directional score   │
+    │  6. Threshold check — score ≥ +4 or ≤ -4?       │
+    │  7. Risk Manager — validate TP/SL and RR         │
+    │  8. State Manager — lock the pair                │
+    │  9. Notifier — queue webhook delivery            │
+    │ 10. Metrics Exporter — queue InfluxDB point      │
     └─────────────────────────────────────────────────┘
 
-All five pairs are processed **concurrently** via ``asyncio.gather``, sharing
+All five pairs are processed **concurrently** by persistent worker tasks, sharing
 a single exchange connection and a single HTTP session for efficiency.
-The InfluxDB exporter is also shared so connections are pooled.
+Webhook delivery and InfluxDB writes both run in the background: signals go
+to a bounded pool of dispatch workers, and each pair's metrics point is
+queued for a batched writer, so no pair waits on either.
 
 Run:
     python main_live.py
@@ -31,12 +32,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import sys
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import Final, Optional
 
-import aiohttp
 import ccxt.async_support as ccxt
 
 from config import (
@@ -44,11 +45,21 @@ from config import (
     SCORE_LONG_THRESHOLD,
     SCORE_SHORT_THRESHOLD,
     TRADING_PAIRS,
-    WEBHOOK_HEADERS,
 )
-from data_ingestion import create_exchange, fetch_extended_ohlcv, fetch_orderbook
+from data_ingestion import (
+    Candles,
+    create_exchange,
+    fetch_extended_ohlcv,
+    fetch_last_price,
+    fetch_orderbook,
+)
 from logic_filters import gate_anti_wash_trading, gate_session_killzone
-from notifier import send_signal
+from notifier import (
+    SignalDispatcher,
+    close_default_session,
+    new_webhook_session,
+    warm_webhook,
+)
 from metrics_exporter import InfluxDBExporter
 from risk_manager import RiskParams, calculate_risk_params
 from scoring_engine import compute_score
@@ -82,6 +93,9 @@ def _configure_logging() -> None:
 
 logger = logging.getLogger("neko.main")
 
+# Log tag per configured pair, e.g. "[BTC]", built once instead of per cycle.
+_PAIR_TAGS: Final[dict[str, str]] = {s: f"[{s.split('/')[0]}]" for s in TRADING_PAIRS}
+
 
 # ---------------------------------------------------------------------------
 # Per-Pair Pipeline Coroutine
@@ -91,7 +105,7 @@ async def _process_pair(
     symbol: str,
     exchange: ccxt.Exchange,
     state_manager: StateManager,
-    http_session: aiohttp.ClientSession,
+    dispatcher: SignalDispatcher,
     exporter: InfluxDBExporter,
 ) -> None:
     """Executes the full signal pipeline for a single trading pair.
@@ -104,10 +118,10 @@ async def _process_pair(
         symbol:        ccxt-formatted trading symbol.
         exchange:      Shared async ccxt exchange instance.
         state_manager: Shared ``StateManager`` instance.
-        http_session:  Shared ``aiohttp.ClientSession`` for webhook delivery.
+        dispatcher:    Shared ``SignalDispatcher`` for webhook delivery.
         exporter:      Shared ``InfluxDBExporter`` for metrics telemetry.
     """
-    tag: str = f"[{symbol.split('/')[0]}]"  # e.g. "[BTC]" for clean logs
+    tag: str = _PAIR_TAGS.get(symbol) or f"[{symbol.split('/')[0]}]"  # e.g. "[BTC]"
 
     try:
         # ------------------------------------------------------------------ #
@@ -118,64 +132,74 @@ async def _process_pair(
         #     return
 
         # ------------------------------------------------------------------ #
-        # Step 2: Fetch Data                                                  #
+        # Step 2: Open Position — ticker-only TP/SL check                     #
+        # ------------------------------------------------------------------ #
+        # A locked pair cannot take a new signal, so it skips the OHLCV and
+        # orderbook fetch, Gate 2 and scoring; the last price is enough to
+        # resolve TP/SL.
+        if not state_manager.is_idle(symbol):
+            last_price: Optional[float] = await fetch_last_price(exchange, symbol)
+            if last_price is None:
+                logger.warning("%s Skipping: ticker fetch failed.", tag)
+                return
+            state_manager.update_virtual_positions({symbol: last_price})
+
+            if not state_manager.is_idle(symbol):
+                state_name: str = state_manager.get_state(symbol).name
+                logger.info(
+                    "%s Position open (%s). Awaiting TP/SL. Skipping new signal.",
+                    tag, state_name,
+                )
+                # Still export a price point every cycle while the position is open
+                await exporter.export_position_metrics(
+                    symbol=symbol,
+                    price=last_price,
+                    trade_state=state_name,
+                )
+                return
+            # TP/SL just resolved: the pair is IDLE again, run the full pipeline
+
+        # ------------------------------------------------------------------ #
+        # Step 3: Fetch Data                                                  #
         # ------------------------------------------------------------------ #
         df, orderbook = await asyncio.gather(
             fetch_extended_ohlcv(exchange, symbol),
             fetch_orderbook(exchange, symbol),
         )
 
-        if df is None or df.empty:
+        if df is None or len(df) == 0:
             logger.warning("%s Skipping: OHLCV fetch failed.", tag)
             return
 
-        _last_vol = float(df["volume"].iloc[-1])
-        logger.info(
-            "%s OHLCV | %d candles | Close=%.4f | Vol=%.2f | TakerBuy=%.1f%%",
-            tag, len(df),
-            float(df["close"].iloc[-1]),
-            _last_vol,
-            float(df["taker_buy_volume"].iloc[-1]) / (_last_vol + 1e-12) * 100,
-        )
+        # Column arrays shared by Gate 2, scoring and the exporter,
+        # so the frame is unpacked once per cycle.
+        candles: Candles = Candles.from_frame(df)
 
-        # ------------------------------------------------------------------ #
-        # Step 3: Gate 2 — Anti-Wash Trading                                  #
-        # ------------------------------------------------------------------ #
-        if not gate_anti_wash_trading(df, symbol):
-            logger.info("%s Gate 2 FAIL: Wash-trading signature detected.", tag)
-            return
-
-        # ------------------------------------------------------------------ #
-        # Step 4: Update Virtual Positions (check TP/SL on open trades)       #
-        # ------------------------------------------------------------------ #
-        current_price: float = float(df["close"].iloc[-1])
-        state_manager.update_virtual_positions({symbol: current_price})
+        if logger.isEnabledFor(logging.INFO):
+            last_vol: float = float(candles.volume[-1])
+            logger.info(
+                "%s OHLCV | %d candles | Close=%.4f | Vol=%.2f | TakerBuy=%.1f%%",
+                tag, candles.size,
+                float(candles.close[-1]),
+                last_vol,
+                float(candles.taker_buy[-1]) / (last_vol + 1e-12) * 100,
+            )
 
         # ------------------------------------------------------------------ #
-        # Step 5: Skip if the pair is already in an open position             #
+        # Step 4: Gate 2 — Anti-Wash Trading                                  #
         # ------------------------------------------------------------------ #
-        if not state_manager.is_idle(symbol):
-            logger.info(
-                "%s Position open (%s). Awaiting TP/SL. Skipping new signal.",
-                tag, state_manager.get_state(symbol).name,
-            )
-            # Still export metrics every cycle regardless of position state
-            await exporter.export_live_metrics(
-                symbol=symbol,
-                df=df,
-                score=0,
-                trade_state=state_manager.get_state(symbol).name,
-            )
+        if not gate_anti_wash_trading(candles, symbol):
+            logger.info("%s Gate 2 FAIL: Wash-trading signature detected.", tag)
             return
 
         # ------------------------------------------------------------------ #
-        # Step 6: Scoring Engine                                              #
+        # Step 5: Scoring Engine                                              #
         # ------------------------------------------------------------------ #
-        score: int = compute_score(df, orderbook, symbol)
+        score: int = compute_score(candles, orderbook, symbol)
         logger.info("%s Score = %+d", tag, score)
 
         # ------------------------------------------------------------------ #
-        # Step 7: Threshold Check                                             #
+        # Step 6: Threshold Check                                             #
         # ------------------------------------------------------------------ #
         direction: Optional[str] = None
         if score >= SCORE_LONG_THRESHOLD:
@@ -190,16 +214,16 @@ async def _process_pair(
             # Export metrics even when no signal fires
             await exporter.export_live_metrics(
                 symbol=symbol,
-                df=df,
+                df=candles,
                 score=score,
                 trade_state="IDLE",
             )
             return
 
         # ------------------------------------------------------------------ #
-        # Step 8: Risk Manager — validate TP/SL/RR                           #
+        # Step 7: Risk Manager — validate TP/SL/RR                           #
         # ------------------------------------------------------------------ #
-        risk_params: Optional[RiskParams] = calculate_risk_params(df, direction)
+        risk_params: Optional[RiskParams] = calculate_risk_params(candles, direction, symbol=symbol)
         if risk_params is None:
             logger.info(
                 "%s %s signal (score=%+d) REJECTED by Risk Manager.", tag, direction, score
@@ -207,7 +231,7 @@ async def _process_pair(
             return
 
         # ------------------------------------------------------------------ #
-        # Step 9: Lock the Pair via State Manager                             #
+        # Step 8: Lock the Pair via State Manager                             #
         # ------------------------------------------------------------------ #
         locked: bool = state_manager.lock_pair(
             symbol=symbol,
@@ -223,9 +247,11 @@ async def _process_pair(
             return
 
         # ------------------------------------------------------------------ #
-        # Step 10: Dispatch Notification                                      #
+        # Steps 9 + 10: Queue Notification and Telemetry                      #
         # ------------------------------------------------------------------ #
-        await send_signal(
+        # Both hand off to background workers, so a slow webhook or InfluxDB
+        # never holds up this pair's cycle.
+        dispatcher.enqueue_signal(
             symbol=symbol,
             direction=direction,
             entry=risk_params["Entry"],
@@ -233,15 +259,10 @@ async def _process_pair(
             sl=risk_params["SL"],
             rr=risk_params["RR"],
             score=score,
-            session=http_session,
         )
-
-        # ------------------------------------------------------------------ #
-        # Step 11: Export Telemetry to InfluxDB (non-blocking, fire-and-forget)
-        # ------------------------------------------------------------------ #
         await exporter.export_live_metrics(
             symbol=symbol,
-            df=df,
+            df=candles,
             score=score,
             trade_state=direction,  # "LONG" or "SHORT" just confirmed
         )
@@ -253,6 +274,47 @@ async def _process_pair(
         logger.exception("%s Unhandled exception in pipeline: %s", tag, exc)
 
 
+# ---------------------------------------------------------------------------
+# Persistent Per-Pair Workers
+# ---------------------------------------------------------------------------
+
+async def _pair_worker(
+    symbol: str,
+    tick: asyncio.Event,
+    done: asyncio.Queue[str],
+    exchange: ccxt.Exchange,
+    state_manager: StateManager,
+    dispatcher: SignalDispatcher,
+    exporter: InfluxDBExporter,
+) -> None:
+    """Long-lived task that runs one pipeline pass for ``symbol`` per tick.
+
+    Waits on its own ``tick`` event, runs ``_process_pair`` and reports the
+    symbol on ``done`` so the scanner knows when the cycle has finished.
+    Unexpected exceptions are logged and the worker keeps serving ticks.
+
+    Args:
+        symbol:        ccxt-formatted trading symbol.
+        tick:          Event set by the scanner to start a cycle.
+        done:          Queue receiving ``symbol`` after each pass.
+        exchange:      Shared async ccxt exchange instance.
+        state_manager: Shared ``StateManager`` instance.
+        dispatcher:    Shared ``SignalDispatcher`` for webhook delivery.
+        exporter:      Shared ``InfluxDBExporter`` for metrics telemetry.
+    """
+    while True:
+        await tick.wait()
+        tick.clear()
+        try:
+            await _process_pair(symbol, exchange, state_manager, dispatcher, exporter)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.error("[%s] pair worker raised: %s", symbol, exc)
+        finally:
+            done.put_nowait(symbol)
+
+
 # ---------------------------------------------------------------------------
 # Main Scanner Loop
 # ---------------------------------------------------------------------------
@@ -263,11 +325,17 @@ async def run_scanner() -> None:
     Architecture:
         - A **single** ccxt exchange instance is shared across all pairs to
           respect Binance's rate limits via ccxt's built-in semaphore.
-        - A **single** ``aiohttp.ClientSession`` is shared for connection pooling.
-        - ``asyncio.gather`` with ``return_exceptions=True`` ensures that a
-          crash in one pair's coroutine is logged but does not abort others.
-        - The loop self-adjusts its sleep duration to maintain a constant
-          ``LOOP_INTERVAL_S``-second cadence regardless of processing time.
+        - A **single** ``aiohttp.ClientSession`` is shared for connection
+          pooling, on a connector tuned for keep-alive reuse and cached DNS;
+          it is warmed up at start so the first signal skips the handshake.
+        - Signals are delivered by a ``SignalDispatcher`` worker pool, which
+          caps in-flight POSTs and keeps webhook latency off the scan cycle.
+        - Each pair has a **persistent** worker task woken by its own tick
+          event; a crash in one pair's pipeline is logged without aborting
+          the others, and the cycle ends once every worker reports done.
+        - The loop sleeps until an absolute ``loop.time()`` deadline that
+          advances by ``LOOP_INTERVAL_S`` each cycle, keeping a constant
+          cadence regardless of processing time or wall-clock jumps.
     """
     _configure_logging()
 
@@ -285,11 +353,29 @@ async def run_scanner() -> None:
     logger.info("✓ Binance connected — %d instruments loaded.", len(exchange.markets))
     exporter: InfluxDBExporter = InfluxDBExporter()
 
-    async with aiohttp.ClientSession(headers=WEBHOOK_HEADERS) as http_session:
+    async with new_webhook_session() as http_session:
+        await warm_webhook(http_session)
+        dispatcher: SignalDispatcher = SignalDispatcher(session=http_session)
+        ticks: dict[str, asyncio.Event] = {symbol: asyncio.Event() for symbol in TRADING_PAIRS}
+        done: asyncio.Queue[str] = asyncio.Queue()
+        workers: list[asyncio.Task[None]] = [
+            asyncio.create_task(
+                _pair_worker(symbol, tick, done, exchange, state_manager, dispatcher, exporter),
+                name=f"pair-worker:{symbol}",
+            )
+            for symbol, tick in ticks.items()
+        ]
         try:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
             cycle: int = 0
+            overrun_count: int = 0
+            # Absolute monotonic deadline of the next cycle, so the cadence
+            # does not drift with processing time or wall-clock adjustments.
+            next_deadline: float = loop.time()
             while True:
                 cycle += 1
+                t0: float = loop.time()
+                next_deadline += LOOP_INTERVAL_S
                 cycle_start: datetime = datetime.now(timezone.utc)
 
                 logger.info(
@@ -297,28 +383,33 @@ async def run_scanner() -> None:
                     cycle,
                     cycle_start.strftime("%Y-%m-%d %H:%M:%S UTC"),
                 )
-                logger.info("Portfolio: %s", state_manager.get_all_states())
-
-                # Run all pair pipelines concurrently
-                results = await asyncio.gather(
-                    *[
-                        _process_pair(symbol, exchange, state_manager, http_session, exporter)
-                        for symbol in TRADING_PAIRS
-                    ],
-                    return_exceptions=True,
-                )
-
-                # Surface any unexpected exceptions returned by gather
-                for symbol, result in zip(TRADING_PAIRS, results):
-                    if isinstance(result, Exception):
-                        logger.error(
-                            "[%s] gather returned exception: %s", symbol, result
-                        )
-
-                elapsed: float = (
-                    datetime.now(timezone.utc) - cycle_start
-                ).total_seconds()
-                sleep_for: float = max(0.0, LOOP_INTERVAL_S - elapsed)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Portfolio: %s", dict(state_manager.get_all_states()))
+
+                # Wake every pair worker, then wait for all of them to finish
+                for tick in ticks.values():
+                    tick.set()
+                for _ in workers:
+                    await done.get()
+
+                now: float = loop.time()
+                elapsed: float = now - t0
+                # LOOP_INTERVAL_S <= 0 means back-to-back cycles: there are no
+                # slots to skip, and the deadline never moves past ``now``.
+                if LOOP_INTERVAL_S > 0 and now > next_deadline:
+                    # Overran: skip the missed slots instead of firing them
+                    # back-to-back, which would only pile more load on a
+                    # stalled exchange.
+                    overrun: float = now - next_deadline
+                    skipped: int = math.ceil(overrun / LOOP_INTERVAL_S)
+                    next_deadline += skipped * LOOP_INTERVAL_S
+                    overrun_count += 1
+                    logger.warning(
+                        "Cycle #%d overran by %.2fs, skipping %d cycle(s) to catch up "
+                        "(%d overruns so far).",
+                        cycle, overrun, skipped, overrun_count,
+                    )
+                sleep_for: float = max(0.0, next_deadline - now)
 
                 logger.info(
                     "Cycle #%d complete in %.2fs. Next cycle in %.2fs.",
@@ -331,7 +422,12 @@ async def run_scanner() -> None:
         except KeyboardInterrupt:
             logger.info("KeyboardInterrupt received — shutting down.")
         finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await dispatcher.close()
             await exporter.close()
+            await close_default_session()
             await exchange.close()
             logger.info("Exchange connection closed. NekoSignal stopped. Goodbye. 🐾")
 
@@ -341,6 +437,14 @@ async def run_scanner() -> None:
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    # uvloop speeds up the socket and scheduling paths every module relies
+    # on; the stock asyncio loop is used where it is not installed.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(run_scanner())
     except KeyboardInterrupt:
@@ -3,9 +3,11 @@ Metrics Exporter (The Telemetry Layer) for Neko Signal System.
 
 Ships real-time market microstructure indicators and trade-state tags to
 an InfluxDB v2 time-series database using the fully **async** client
-(``InfluxDBClientAsync``).  All writes are fire-and-forget — database
-unavailability is logged as a WARNING and silently swallowed so that the
-trading pipeline is **never** blocked or crashed by telemetry issues.
+(``InfluxDBClientAsync``).  Points are queued in memory and written in
+batches by a background task, off the trading pipeline's critical path.
+All writes are fire-and-forget — database unavailability is logged as a
+WARNING and silently swallowed so that the trading pipeline is **never**
+blocked or crashed by telemetry issues.
 
 Data Model
 ----------
@@ -19,19 +21,31 @@ Fields      : ``close``       — last close price (float)
               ``vwap``        — session VWAP (float)
               ``score``       — directional score in [-5, +5] (int → stored as float)
 
+While a pair holds a position only its ticker is fetched, so its points
+carry ``close`` = last traded price (not a candle close) and ``score`` = 0;
+``volume``, ``ofi``, ``cvd`` and ``vwap`` repeat the pair's last full
+point and are omitted until the process has written one.
+
 Grafana reads this bucket via the **Flux** query language.
 See ``GRAFANA_GUIDE.md`` for ready-to-paste dashboard queries.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
 from influxdb_client.client.write_api import ASYNCHRONOUS
+from influxdb_client.client.write_api_async import WriteApiAsync
 from influxdb_client.domain.write_precision import WritePrecision
 
 from config import (
@@ -42,60 +56,161 @@ from config import (
     INFLUXDB_URL,
     OFI_WINDOW,
     PAIR_DISPLAY_NAMES,
+    TRADING_PAIRS,
 )
+from data_ingestion import Candles
 
 logger = logging.getLogger(__name__)
 
+# Background writer tuning: points per write, how long a partial batch may
+# wait for more points, queue bound (new points are dropped beyond it) and
+# how long ``close()`` waits for queued points to be written.
+DEFAULT_MAX_BATCH: int = 500
+DEFAULT_FLUSH_INTERVAL_S: float = 1.0
+DEFAULT_QUEUE_SIZE: int = 10_000
+DEFAULT_CLOSE_TIMEOUT_S: float = 10.0
+
 
 # ---------------------------------------------------------------------------
-# Internal Indicator Helpers (vectorised, re-used from scoring_engine logic)
+# Internal Indicator Helpers (NumPy tail slices, mirroring scoring_engine logic)
 # ---------------------------------------------------------------------------
 
-def _compute_ofi_last(df: pd.DataFrame) -> float:
-    """Returns the rolling-mean OFI value for the last completed candle.
+def _compute_flow_last(candles: Candles) -> tuple[float, float]:
+    """Returns the rolling OFI mean and the rolling CVD for the latest candle.
+
+    Both read the same taker delta, so it is computed once over the longer
+    of the two windows and sliced for each.
 
     Args:
-        df: DataFrame with ``[taker_buy_volume, taker_sell_volume]`` columns.
+        candles: Candle arrays with taker buy / sell volumes.
 
     Returns:
-        Rolling OFI float, or 0.0 if data is insufficient.
+        ``(ofi, cvd)``; OFI is 0.0 with fewer than ``OFI_WINDOW`` candles and
+        CVD is 0.0 with fewer than two.
     """
-    if len(df) < OFI_WINDOW:
-        return 0.0
-    ofi: pd.Series = df["taker_buy_volume"] - df["taker_sell_volume"]
-    return float(ofi.rolling(OFI_WINDOW, min_periods=1).mean().iloc[-1])
+    n: int = candles.size
+    if n < 2:
+        return 0.0, 0.0
+    # Only the trailing window feeds the last rolling value.
+    span: int = max(OFI_WINDOW, CVD_WINDOW)
+    delta: np.ndarray = candles.taker_buy[-span:] - candles.taker_sell[-span:]
+    ofi: float = float(delta[-OFI_WINDOW:].mean()) if n >= OFI_WINDOW else 0.0
+    return ofi, float(delta[-CVD_WINDOW:].sum())
 
 
-def _compute_cvd_last(df: pd.DataFrame) -> float:
-    """Returns the last Cumulative Volume Delta (rolling OFI sum) value.
+def _compute_vwap_last(candles: Candles) -> float:
+    """Returns the current session VWAP.
 
     Args:
-        df: DataFrame with ``[taker_buy_volume, taker_sell_volume]`` columns.
+        candles: Candle arrays with ``high, low, close, volume``.
 
     Returns:
-        Rolling CVD float, or 0.0 if data is insufficient.
+        VWAP float, or the latest close price if computation fails.
     """
-    if len(df) < 2:
-        return 0.0
-    ofi: pd.Series = df["taker_buy_volume"] - df["taker_sell_volume"]
-    return float(ofi.rolling(CVD_WINDOW, min_periods=1).sum().iloc[-1])
+    cum_vol: float = float(candles.volume.sum())
+    if cum_vol <= 0.0:
+        return float(candles.close[-1])
+    # One dot product replaces the element-wise multiply and its reduction.
+    typical_price: np.ndarray = (candles.high + candles.low + candles.close) / 3.0
+    return float(np.dot(candles.volume, typical_price)) / cum_vol
 
 
-def _compute_vwap_last(df: pd.DataFrame) -> float:
-    """Returns the current session VWAP.
+@dataclass
+class _FlowState:
+    """Taker-delta windows of a symbol's completed candles, for OFI and CVD.
+
+    The live candle (index ``-1``) is still forming, so its delta is added on
+    top of these windows at read time rather than stored.
+
+    Attributes:
+        last_ts: Timestamp (``Candles.ts``) of the completed candle the
+                 windows end on.
+        ofi_win: Last ``OFI_WINDOW - 1`` completed deltas.
+        cvd_win: Last ``CVD_WINDOW - 1`` completed deltas.
+    """
+    last_ts: int
+    ofi_win: deque[float]
+    cvd_win: deque[float]
+
+
+# Keyed by symbol. A scan one candle after the last only appends one delta.
+_FLOW_CACHE: dict[str, _FlowState] = {}
+
+
+def _flow_last(symbol: str, candles: Candles) -> tuple[float, float]:
+    """Returns ``(ofi, cvd)`` like ``_compute_flow_last``, updated incrementally.
+
+    While the completed candle is unchanged only the live delta is re-read;
+    when exactly one new candle has closed its delta is pushed onto the
+    windows. Anything else (gaps, short history) rebuilds from the arrays.
 
     Args:
-        df: DataFrame with ``[high, low, close, volume]`` columns.
+        symbol:  Cache key.
+        candles: Candle arrays with taker buy / sell volumes.
 
     Returns:
-        VWAP float, or the latest close price if computation fails.
+        ``(ofi, cvd)`` for the latest candle.
     """
-    typical_price: pd.Series = (df["high"] + df["low"] + df["close"]) / 3.0
-    cum_tp_vol: float = float((typical_price * df["volume"]).sum())
-    cum_vol: float = float(df["volume"].sum())
-    if cum_vol <= 0.0:
-        return float(df["close"].iloc[-1])
-    return cum_tp_vol / cum_vol
+    span: int = max(OFI_WINDOW, CVD_WINDOW)
+    if candles.size < span + 1:
+        return _compute_flow_last(candles)
+
+    completed_ts: int = int(candles.ts[-2])
+    state: Optional[_FlowState] = _FLOW_CACHE.get(symbol)
+
+    if state is None or state.last_ts not in (completed_ts, candles.ts[-3]):
+        delta: np.ndarray = candles.taker_buy[-span:-1] - candles.taker_sell[-span:-1]
+        state = _FLOW_CACHE[symbol] = _FlowState(
+            last_ts=completed_ts,
+            ofi_win=deque(delta[delta.size - (OFI_WINDOW - 1):].tolist(), maxlen=OFI_WINDOW - 1),
+            cvd_win=deque(delta[delta.size - (CVD_WINDOW - 1):].tolist(), maxlen=CVD_WINDOW - 1),
+        )
+    elif state.last_ts != completed_ts:
+        closed: float = float(candles.taker_buy[-2] - candles.taker_sell[-2])
+        state.ofi_win.append(closed)
+        state.cvd_win.append(closed)
+        state.last_ts = completed_ts
+
+    live: float = float(candles.taker_buy[-1] - candles.taker_sell[-1])
+    return (sum(state.ofi_win) + live) / OFI_WINDOW, sum(state.cvd_win) + live
+
+
+# ---------------------------------------------------------------------------
+# Line Protocol Serialisation
+# ---------------------------------------------------------------------------
+
+def _escape_tag(value: str) -> str:
+    """Escapes commas, equals signs and spaces in a line-protocol tag value."""
+    return value.replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+
+def _format_line(
+    prefix: str,
+    trade_state: str,
+    fields: tuple[tuple[str, float], ...],
+    ts_ns: int,
+) -> Optional[str]:
+    """Builds one ``market_data`` line-protocol record.
+
+    Non-finite field values are omitted, as InfluxDB rejects ``NaN`` and
+    ``inf`` (the client's dict serialiser drops them the same way).
+
+    Args:
+        prefix:      Measurement plus ``symbol`` tag, e.g.
+                     ``"market_data,symbol=BTCUSDT"``.
+        trade_state: ``trade_state`` tag value.
+        fields:      ``(name, value)`` float field pairs.
+        ts_ns:       Timestamp in epoch nanoseconds.
+
+    Returns:
+        The record string, or ``None`` if no field value is finite.
+    """
+    field_set: str = ",".join(
+        f"{name}={value!r}" for name, value in fields if math.isfinite(value)
+    )
+    if not field_set:
+        return None
+    return f"{prefix},trade_state={_escape_tag(trade_state)} {field_set} {ts_ns}"
 
 
 # ---------------------------------------------------------------------------
@@ -109,11 +224,16 @@ class InfluxDBExporter:
     the main loop.  The underlying ``InfluxDBClientAsync`` maintains its own
     internal connection pool; consumers should call ``close()`` on shutdown.
 
+    ``export_live_metrics`` only formats the point and puts it on an
+    ``asyncio.Queue``; a background writer task drains the queue in batches
+    of up to ``max_batch`` points (or whatever arrived within
+    ``flush_interval_s``), so pair pipelines never wait on InfluxDB.
+
     Usage::
 
         exporter = InfluxDBExporter()
         await exporter.export_live_metrics(symbol, df, score, trade_state)
-        # ... at shutdown:
+        # ... at shutdown (drains the queue first):
         await exporter.close()
     """
 
@@ -123,6 +243,9 @@ class InfluxDBExporter:
         token: str = INFLUXDB_TOKEN,
         org: str = INFLUXDB_ORG,
         bucket: str = INFLUXDB_BUCKET,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
     ) -> None:
         """Initialises the async InfluxDB client.
 
@@ -134,12 +257,27 @@ class InfluxDBExporter:
             token:  InfluxDB API token with write permission to the bucket.
             org:    InfluxDB organisation name.
             bucket: Destination bucket for ``market_data`` measurements.
+            max_batch: Maximum points sent in one write.
+            flush_interval_s: Longest a partial batch waits for more points.
+            queue_size: Queued points beyond which new points are dropped.
         """
         self._url: str = url
         self._token: str = token
         self._org: str = org
         self._bucket: str = bucket
         self._client: Optional[InfluxDBClientAsync] = None
+        self._write_api: Optional[WriteApiAsync] = None
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._max_batch: int = max_batch
+        self._flush_interval_s: float = flush_interval_s
+        # Fixed ``measurement,symbol=...`` head of each pair's line.
+        self._line_prefixes: dict[str, str] = {
+            sym: self._line_prefix(sym) for sym in TRADING_PAIRS
+        }
+        # Candle-derived fields of each pair's last full point, repeated on
+        # its price-only position points.
+        self._last_flow: dict[str, tuple[tuple[str, float], ...]] = {}
         self._enabled: bool = bool(url and token and org and bucket)
 
         if not self._enabled:
@@ -153,28 +291,46 @@ class InfluxDBExporter:
                 url, org, bucket,
             )
 
+    @staticmethod
+    def _line_prefix(symbol: str) -> str:
+        """Returns the line-protocol measurement and ``symbol`` tag for ``symbol``."""
+        display: str = PAIR_DISPLAY_NAMES.get(symbol, symbol.split("/")[0])
+        return f"market_data,symbol={_escape_tag(display)}"
+
     def _get_client(self) -> InfluxDBClientAsync:
         """Returns (and lazily creates) the shared async client instance."""
         if self._client is None:
+            # Batched line protocol is highly repetitive (measurement and
+            # tag keys on every line), so gzip shrinks each write many-fold.
             self._client = InfluxDBClientAsync(
                 url=self._url,
                 token=self._token,
                 org=self._org,
+                enable_gzip=True,
             )
         return self._client
 
+    def _get_write_api(self) -> WriteApiAsync:
+        """Returns the write API bound to the shared client, created once."""
+        if self._write_api is None:
+            self._write_api = self._get_client().write_api()
+        return self._write_api
+
     async def export_live_metrics(
         self,
         symbol: str,
-        df: pd.DataFrame,
+        df: pd.DataFrame | Candles,
         score: int,
         trade_state: str,
         timestamp: Optional[datetime] = None,
     ) -> None:
-        """Writes a single ``market_data`` data point to InfluxDB.
+        """Queues a single ``market_data`` line-protocol record for writing.
 
-        This method **never raises**. All exceptions are caught and logged at
-        WARNING level so the main trading loop is never interrupted.
+        No network I/O happens here: the record is handed to the background
+        writer, and dropped with a warning if its queue is full (InfluxDB
+        down for a long time). This method **never raises**.
+        All exceptions are caught and logged at WARNING level so the main
+        trading loop is never interrupted.
 
         Data point schema::
 
@@ -193,7 +349,8 @@ class InfluxDBExporter:
 
         Args:
             symbol:      ccxt trading symbol (e.g. ``"BTC/USDT:USDT"``).
-            df:          Clean OHLCV DataFrame after Gate 2 passes.
+            df:          Clean OHLCV DataFrame after Gate 2 passes, or the
+                         ``Candles`` view the pipeline already built from it.
             score:       Directional score from the scoring engine [-5, +5].
             trade_state: Current state string: ``"IDLE"``, ``"LONG"``,
                          or ``"SHORT"``.
@@ -202,58 +359,166 @@ class InfluxDBExporter:
         if not self._enabled:
             return
 
-        if df is None or df.empty:
+        if df is None:
+            logger.debug("InfluxDB: empty DataFrame, skipping write.")
+            return
+        candles: Candles = df if isinstance(df, Candles) else Candles.from_frame(df)
+        if candles.size == 0:
             logger.debug("InfluxDB: empty DataFrame, skipping write.")
             return
 
-        ts: datetime = timestamp or datetime.now(timezone.utc)
-        display: str = PAIR_DISPLAY_NAMES.get(symbol, symbol.split("/")[0])
+        # Epoch nanoseconds straight from the clock; no datetime on the hot path.
+        ts_ns: int = int(timestamp.timestamp() * 1e9) if timestamp else time.time_ns()
 
         # Compute indicators
-        close: float = float(df["close"].iloc[-1])
-        volume: float = float(df["volume"].iloc[-1])
-        ofi: float = _compute_ofi_last(df)
-        cvd: float = _compute_cvd_last(df)
-        vwap: float = _compute_vwap_last(df)
-
-        # Build line-protocol point as a dict (influxdb-client accepts dicts)
-        point: dict = {
-            "measurement": "market_data",
-            "tags": {
-                "symbol": display,
-                "trade_state": trade_state.upper(),
-            },
-            "fields": {
-                "close": close,
-                "volume": volume,
-                "ofi": ofi,
-                "cvd": cvd,
-                "vwap": vwap,
-                "score": float(score),
-            },
-            "time": ts,
-        }
+        close: float = float(candles.close[-1])
+        volume: float = float(candles.volume[-1])
+        ofi, cvd = _flow_last(symbol, candles)
+        vwap: float = _compute_vwap_last(candles)
+
+        flow: tuple[tuple[str, float], ...] = (
+            ("volume", volume),
+            ("ofi", ofi),
+            ("cvd", cvd),
+            ("vwap", vwap),
+        )
+        self._last_flow[symbol] = flow
+
+        # Format the line-protocol record directly; the schema is fixed, so
+        # the client's per-record dict conversion is pure overhead.
+        line: Optional[str] = _format_line(
+            self._prefix_for(symbol),
+            trade_state.upper(),
+            (("close", close), *flow, ("score", float(score))),
+            ts_ns,
+        )
+        if self._enqueue(symbol, line) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "InfluxDB queued [%s] state=%s close=%.4f score=%+d ofi=%.2f",
+                symbol, trade_state, close, score, ofi,
+            )
+
+    async def export_position_metrics(
+        self,
+        symbol: str,
+        price: float,
+        trade_state: str,
+    ) -> None:
+        """Queues a price-only ``market_data`` point for a pair with an open position.
+
+        Used on the locked-pair fast path, where only a ticker is fetched:
+        the point carries ``close`` (the ticker price), ``score = 0`` and the
+        ``volume`` / ``ofi`` / ``cvd`` / ``vwap`` of the pair's last
+        :meth:`export_live_metrics` point, so those series do not gap while
+        the position is open. With no earlier point they are omitted.
+        This method **never raises**.
 
+        Args:
+            symbol:      ccxt trading symbol.
+            price:       Latest traded price.
+            trade_state: ``"LONG"`` or ``"SHORT"``.
+        """
+        if not self._enabled:
+            return
+        line: Optional[str] = _format_line(
+            self._prefix_for(symbol),
+            trade_state.upper(),
+            (
+                ("close", float(price)),
+                *self._last_flow.get(symbol, ()),
+                ("score", 0.0),
+            ),
+            time.time_ns(),
+        )
+        self._enqueue(symbol, line)
+
+    def _prefix_for(self, symbol: str) -> str:
+        """Returns the cached line prefix for ``symbol``, building it on a miss."""
+        prefix: Optional[str] = self._line_prefixes.get(symbol)
+        if prefix is None:
+            prefix = self._line_prefixes[symbol] = self._line_prefix(symbol)
+        return prefix
+
+    def _enqueue(self, symbol: str, line: Optional[str]) -> bool:
+        """Hands ``line`` to the background writer; returns whether it was queued."""
+        if line is None:
+            logger.debug("InfluxDB: no finite fields for [%s], skipping write.", symbol)
+            return False
         try:
-            client: InfluxDBClientAsync = self._get_client()
-            write_api = client.write_api()
-            await write_api.write(
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            logger.warning(
+                "InfluxDB queue full (%d points) — dropping [%s] point.",
+                self._queue.maxsize, symbol,
+            )
+            return False
+        self._ensure_writer()
+        return True
+
+    def _ensure_writer(self) -> None:
+        """Starts the background writer task on first use (needs a running loop)."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(
+                self._writer_loop(), name="influxdb-writer"
+            )
+
+    async def _writer_loop(self) -> None:
+        """Drains the queue forever, one batched write per collected batch."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            lines: list[str] = [await self._queue.get()]
+            deadline: float = loop.time() + self._flush_interval_s
+            while len(lines) < self._max_batch:
+                remaining: float = deadline - loop.time()
+                if remaining <= 0.0:
+                    break
+                try:
+                    lines.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write_lines(lines)
+            finally:
+                for _ in lines:
+                    self._queue.task_done()
+
+    async def flush(self) -> None:
+        """Writes every currently queued point immediately, bypassing the timer.
+
+        This method **never raises**.
+        """
+        lines: list[str] = []
+        while not self._queue.empty():
+            lines.append(self._queue.get_nowait())
+        if not lines:
+            return
+        try:
+            await self._write_lines(lines)
+        finally:
+            for _ in lines:
+                self._queue.task_done()
+
+    async def _write_lines(self, lines: list[str]) -> None:
+        """Sends ``lines`` as one line-protocol payload; logs and drops on failure.
+
+        Points are never retried, so a database outage cannot grow memory
+        beyond the queue bound.
+        """
+        try:
+            await self._get_write_api().write(
                 bucket=self._bucket,
                 org=self._org,
-                record=point,
-                precision=WritePrecision.SECONDS,
-            )
-            logger.debug(
-                "InfluxDB ✓ [%s] state=%s close=%.4f score=%+d ofi=%.2f",
-                display, trade_state, close, score, ofi,
+                record="\n".join(lines),
+                write_precision=WritePrecision.NS,
             )
+            logger.debug("InfluxDB ✓ flushed %d points.", len(lines))
 
         except Exception as exc:  # noqa: BLE001
             # ⚠️  Intentionally broad: telemetry failure must NEVER crash the bot.
             logger.warning(
-                "InfluxDB write FAILED for [%s] — %s: %s. "
+                "InfluxDB batch write FAILED (%d points dropped) — %s: %s. "
                 "Trading loop continues unaffected.",
-                display,
+                len(lines),
                 type(exc).__name__,
                 exc,
             )
@@ -262,8 +527,23 @@ class InfluxDBExporter:
         """Gracefully closes the underlying async InfluxDB client connection.
 
         Should be called once during application shutdown (``finally`` block
-        in ``main_live.py``).
+        in ``main_live.py``). Queued points are given up to
+        ``DEFAULT_CLOSE_TIMEOUT_S`` to be written before the writer stops.
         """
+        if self._writer_task is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), DEFAULT_CLOSE_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "InfluxDBExporter: %d queued points not written before shutdown.",
+                    self._queue.qsize(),
+                )
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         if self._client is not None:
             try:
                 await self._client.close()
@@ -272,3 +552,4 @@ class InfluxDBExporter:
                 logger.warning("InfluxDBExporter: error on close — %s", exc)
             finally:
                 self._client = None
+                self._write_api = None
@@ -6,37 +6,266 @@ Responsible for:
     2. Dispatching the payload asynchronously to the configured webhook URL.
 
 Design choices:
-    - ``build_signal_payload`` is a pure function — fully testable without I/O.
+    - ``build_signal_payload`` is a pure function — fully testable without I/O;
+      ``build_signal_body_bytes`` is its encoded twin for the send path.
     - ``send_signal`` accepts an optional shared ``aiohttp.ClientSession`` to
-      enable connection pooling when called from the main loop. Falls back to
-      creating its own session for standalone usage.
+      enable connection pooling when called from the main loop. Without one
+      it reuses a lazily created module-level session, so standalone callers
+      still keep connections alive; ``close_default_session()`` releases it.
     - All network errors are caught and logged; the function never raises so
       that a webhook failure never crashes the main loop.
+    - Transient failures (429/502/503/504, or a connection that was never
+      established) are retried up to ``MAX_RETRIES`` times with jittered
+      exponential back-off. 429, 503 and connect errors mean the signal was
+      not processed; a 502/504 from a proxy may follow an origin that did
+      act on it, so those retries can deliver a signal twice. Timeouts and
+      mid-request disconnects are never retried: the receiver may already
+      have acted on the body, and the webhook is not idempotent.
+    - A per-URL circuit breaker fails fast while an endpoint is down, so
+      signals do not each wait out ``WEBHOOK_TIMEOUT_S``.
+    - ``SignalDispatcher`` runs ``send_signal`` on a bounded pool of
+      background workers, so callers enqueue and move on while the number
+      of in-flight POSTs stays capped.
+    - ``SignalBatcher`` is an opt-in fire-and-forget path that coalesces
+      signals raised close together into one ``"signals"`` array POST.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import random
+import time
+from dataclasses import dataclass
+from typing import Final, Optional
 
 import aiohttp
+import orjson
 
 from config import (
+    MAX_RETRIES,
     PAIR_DISPLAY_NAMES,
     WEBHOOK_HEADERS,
+    WEBHOOK_PRETTY,
     WEBHOOK_TIMEOUT_S,
     WEBHOOK_URL,
 )
 
 logger = logging.getLogger(__name__)
 
+# orjson emits UTF-8 bytes directly (emoji included), so aiohttp posts the
+# body as-is. OPT_SERIALIZE_NUMPY accepts numpy scalars callers may pass in.
+# Bodies are compact for the machine consumer unless WEBHOOK_PRETTY is set.
+_JSON_OPTIONS: Final[int] = orjson.OPT_SERIALIZE_NUMPY | (
+    orjson.OPT_INDENT_2 if WEBHOOK_PRETTY else 0
+)
+
+# Webhook connection pool: a handful of keep-alive sockets to one stable
+# host, with DNS answers cached for ten minutes instead of the default 10 s.
+# Idle sockets outlive one 60 s scan cycle so the next signal reuses them.
+_HTTP_POOL_LIMIT: Final[int] = 32
+_HTTP_POOL_LIMIT_PER_HOST: Final[int] = 8
+_HTTP_DNS_CACHE_TTL_S: Final[int] = 600
+_HTTP_KEEPALIVE_S: Final[float] = 75.0
+
+# Immutable, so one instance serves every session and request.
+_TIMEOUT: Final[aiohttp.ClientTimeout] = aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT_S)
+
+# Consecutive failed deliveries that open a URL's breaker, and how long it
+# stays open before a single probe request is let through.
+_BREAKER_FAIL_THRESHOLD: Final[int] = 5
+_BREAKER_RECOVERY_S: Final[float] = 30.0
+
+# Transient statuses worth retrying; other 4xx/5xx mean the request itself
+# is wrong and are never retried. A 502/504 can come from a proxy whose
+# origin already handled the POST, so retrying it may duplicate a signal;
+# that is accepted over dropping one. Delays use full jitter: uniform in
+# [0, min(cap, base × 2^attempt)] so concurrent pairs do not retry in step.
+_RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 502, 503, 504})
+_RETRY_BASE_S: Final[float] = 0.25
+_RETRY_CAP_S: Final[float] = 4.0
+
+# SignalBatcher defaults: how long the first queued signal waits for company,
+# the most signals one POST carries, and the shutdown drain budget.
+DEFAULT_BATCH_WINDOW_S: Final[float] = 0.1
+DEFAULT_BATCH_MAX: Final[int] = 20
+DEFAULT_BATCH_CLOSE_TIMEOUT_S: Final[float] = 10.0
+
+# SignalDispatcher bulkhead: concurrent in-flight POSTs, queued signals held
+# before new ones are dropped, and the shutdown drain budget.
+DEFAULT_DISPATCH_WORKERS: Final[int] = 8
+DEFAULT_DISPATCH_QUEUE_SIZE: Final[int] = 1_000
+DEFAULT_DISPATCH_CLOSE_TIMEOUT_S: Final[float] = 30.0
+
+
+# ---------------------------------------------------------------------------
+# HTTP Sessions
+# ---------------------------------------------------------------------------
+
+def new_webhook_session() -> aiohttp.ClientSession:
+    """Creates a ``ClientSession`` tuned for repeated webhook delivery.
+
+    Must be called from within a running event loop. The caller owns the
+    session and is responsible for closing it.
+
+    Returns:
+        A session with ``WEBHOOK_HEADERS``, a ``WEBHOOK_TIMEOUT_S`` total
+        timeout and a keep-alive, DNS-caching connector.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=_HTTP_POOL_LIMIT,
+        limit_per_host=_HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=_HTTP_DNS_CACHE_TTL_S,
+        keepalive_timeout=_HTTP_KEEPALIVE_S,
+    )
+    return aiohttp.ClientSession(
+        headers=WEBHOOK_HEADERS,
+        connector=connector,
+        timeout=_TIMEOUT,
+    )
+
+
+# Fallback session for callers that do not pass one, created on first use
+# and reused afterwards; closed by ``close_default_session()``.
+_default_session: Optional[aiohttp.ClientSession] = None
+_session_lock: asyncio.Lock = asyncio.Lock()
+
+
+async def _get_default_session() -> aiohttp.ClientSession:
+    """Returns the module-level fallback session, creating it once."""
+    global _default_session
+    if _default_session is None or _default_session.closed:
+        async with _session_lock:
+            if _default_session is None or _default_session.closed:
+                _default_session = new_webhook_session()
+    return _default_session
+
+
+async def warm_webhook(
+    session: aiohttp.ClientSession, webhook_url: str = WEBHOOK_URL
+) -> bool:
+    """Opens a keep-alive connection to the webhook host ahead of the first signal.
+
+    Sends a ``HEAD`` request so DNS resolution and the TCP/TLS handshake are
+    paid at start-up; any HTTP status counts, since only the pooled socket
+    matters. This function **never raises**.
+
+    Args:
+        session:     Session whose pool should hold the warm connection.
+        webhook_url: URL whose host is contacted.
+
+    Returns:
+        ``True`` if the host answered, ``False`` if it could not be reached.
+    """
+    try:
+        async with session.head(webhook_url, allow_redirects=False) as response:
+            logger.info("Webhook host warmed up (HTTP %d).", response.status)
+            return True
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Webhook warm-up failed — first signal will connect cold: %s", exc)
+        return False
+
+
+async def close_default_session() -> None:
+    """Closes the fallback session, if one was created. Safe to call repeatedly."""
+    global _default_session
+    if _default_session is not None:
+        await _default_session.close()
+        _default_session = None
+
+
+# ---------------------------------------------------------------------------
+# Circuit Breaker
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _CircuitBreaker:
+    """CLOSED → OPEN → HALF_OPEN breaker guarding one webhook URL.
+
+    Attributes:
+        state:          ``"CLOSED"`` (normal), ``"OPEN"`` (failing fast) or
+                        ``"HALF_OPEN"`` (one probe request in flight).
+        failure_count:  Consecutive failed deliveries.
+        opened_at:      ``time.monotonic()`` when the breaker last opened.
+    """
+    state: str = "CLOSED"
+    failure_count: int = 0
+    opened_at: float = 0.0
+
+    def allow_request(self) -> bool:
+        """Returns ``True`` if a delivery may be attempted right now."""
+        if self.state == "CLOSED":
+            return True
+        if self.state == "OPEN" and time.monotonic() - self.opened_at >= _BREAKER_RECOVERY_S:
+            self.state = "HALF_OPEN"
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Closes the breaker and resets the failure streak."""
+        self.state = "CLOSED"
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Counts a failure; opens the breaker at the threshold or on a failed probe."""
+        self.failure_count += 1
+        if self.state == "HALF_OPEN" or self.failure_count >= _BREAKER_FAIL_THRESHOLD:
+            if self.state != "OPEN":
+                logger.warning(
+                    "Webhook circuit OPEN after %d consecutive failures; "
+                    "pausing delivery for %.0fs.",
+                    self.failure_count, _BREAKER_RECOVERY_S,
+                )
+            self.state = "OPEN"
+            self.opened_at = time.monotonic()
+
+
+_breakers: dict[str, _CircuitBreaker] = {}
+
+
+def _breaker_for(webhook_url: str) -> _CircuitBreaker:
+    """Returns the circuit breaker for ``webhook_url``, creating it once."""
+    breaker: Optional[_CircuitBreaker] = _breakers.get(webhook_url)
+    if breaker is None:
+        breaker = _breakers[webhook_url] = _CircuitBreaker()
+    return breaker
+
 
 # ---------------------------------------------------------------------------
 # Payload Builder (pure function)
 # ---------------------------------------------------------------------------
 
+# Every string the payload can hold besides prices and the timestamp comes
+# from a tiny finite domain, so it is built once here and looked up per call.
+_EMOJI: Final[dict[str, str]] = {"LONG": "🟢 LONG", "SHORT": "🔴 SHORT"}
+_SCORE_BAR: Final[dict[int, str]] = {
+    i: "█" * abs(i) + "░" * (5 - abs(i)) for i in range(-5, 6)
+}
+_SCORE_LABEL: Final[dict[int, str]] = {
+    i: f"{'+' if i > 0 else ''}{i}/5" for i in range(-5, 6)
+}
+_META: Final[dict[str, str]] = {
+    "session": "US Killzone",
+    "strategy": "Market Microstructure + Volume Profile",
+}
+
+
+# Last formatted timestamp, keyed by its epoch second: (second, string).
+_last_stamp: tuple[int, str] = (-1, "")
+
+
+def _iso_now_utc() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS+00:00``, formatted once per second.
+
+    Same text as ``datetime.now(timezone.utc).isoformat(timespec="seconds")``.
+    """
+    global _last_stamp
+    now: int = int(time.time())
+    if now != _last_stamp[0]:
+        _last_stamp = (now, time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now)))
+    return _last_stamp[1]
+
+
 def build_signal_payload(
     symbol: str,
     direction: str,
@@ -62,7 +291,7 @@ def build_signal_payload(
         score:     Directional score in ``[-5, +5]``.
 
     Returns:
-        A ``dict`` ready for ``json.dumps``. Keys follow a stable schema
+        A ``dict`` ready for JSON serialisation. Keys follow a stable schema
         versioned via the ``"schema_version"`` field.
 
     Example payload (LONG on BTCUSDT)::
@@ -89,19 +318,69 @@ def build_signal_payload(
             }
         }
     """
+    payload: dict = _assemble(symbol, direction, entry, tp, sl, rr, score)
+    # Copied so a caller mutating the payload cannot alter the template
+    payload["meta"] = dict(_META)
+    return payload
+
+
+def build_signal_body_bytes(
+    symbol: str,
+    direction: str,
+    entry: float,
+    tp: float,
+    sl: float,
+    rr: float,
+    score: int,
+) -> bytes:
+    """Returns the ``build_signal_payload`` document already encoded as JSON.
+
+    For callers that only send the payload: the dict never escapes, so the
+    shared ``meta`` template is serialised in place rather than copied.
+    Compact unless ``WEBHOOK_PRETTY`` is set.
+
+    Args:
+        symbol:    ccxt-formatted trading symbol.
+        direction: ``"LONG"`` or ``"SHORT"``.
+        entry:     Entry price.
+        tp:        Take-profit price level.
+        sl:        Stop-loss price level.
+        rr:        Risk:Reward ratio.
+        score:     Directional score in ``[-5, +5]``.
+
+    Returns:
+        UTF-8 JSON bytes ready to POST.
+    """
+    return orjson.dumps(
+        _assemble(symbol, direction, entry, tp, sl, rr, score), option=_JSON_OPTIONS
+    )
+
+
+def _assemble(
+    symbol: str,
+    direction: str,
+    entry: float,
+    tp: float,
+    sl: float,
+    rr: float,
+    score: int,
+) -> dict:
+    """Builds the payload dict; ``"meta"`` references the shared ``_META``."""
     display_name: str = PAIR_DISPLAY_NAMES.get(symbol, symbol)
     direction_upper: str = direction.upper()
-    emoji: str = "🟢 LONG" if direction_upper == "LONG" else "🔴 SHORT"
+    emoji: str = _EMOJI.get(direction_upper, "🔴 SHORT")
 
     # Visual score bar: filled blocks for magnitude, grey for remainder
-    abs_score: int = abs(score)
-    score_bar: str = "█" * abs_score + "░" * (5 - abs_score)
-    score_label: str = f"{'+' if score > 0 else ''}{score}/5"
+    score_bar: Optional[str] = _SCORE_BAR.get(score)
+    if score_bar is None:  # outside [-5, +5]; build it the long way
+        abs_score: int = abs(score)
+        score_bar = "█" * abs_score + "░" * (5 - abs_score)
+    score_label: str = _SCORE_LABEL.get(score) or f"{'+' if score > 0 else ''}{score}/5"
 
     return {
         "schema_version": "1.0",
         "system": "Neko Signal",
-        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        "timestamp_utc": _iso_now_utc(),
         "signal": {
             "pair": display_name,
             "direction": direction_upper,
@@ -114,10 +393,7 @@ def build_signal_payload(
             "score_label": score_label,
             "score_bar": score_bar,
         },
-        "meta": {
-            "session": "US Killzone",
-            "strategy": "Market Microstructure + Volume Profile",
-        },
+        "meta": _META,
     }
 
 
@@ -139,7 +415,7 @@ async def send_signal(
     """Builds and POSTs a structured signal payload to the configured webhook.
 
     Handles both shared-session (production, connection-pooled) and
-    standalone-session (testing) modes transparently.
+    standalone (module fallback session) modes transparently.
 
     Args:
         symbol:      ccxt trading symbol.
@@ -152,59 +428,375 @@ async def send_signal(
         webhook_url: Override the default ``WEBHOOK_URL`` from config.
         session:     Optional shared ``aiohttp.ClientSession``. When provided,
                      this function does **not** close it after use, leaving
-                     lifecycle management to the caller. When ``None``, a
-                     temporary session is created and closed after the call.
+                     lifecycle management to the caller. When ``None``, the
+                     module-level fallback session is used (and kept open).
 
     Returns:
         ``True`` if the webhook responded with HTTP 2xx.
-        ``False`` on any network error, timeout, or non-2xx status.
+        ``False`` on any network error, timeout, or non-2xx status, and
+        without a request while the URL's circuit breaker is open.
     """
-    payload: dict = build_signal_payload(symbol, direction, entry, tp, sl, rr, score)
-    json_body: str = json.dumps(payload, ensure_ascii=False, indent=2)
+    json_body: bytes = build_signal_body_bytes(symbol, direction, entry, tp, sl, rr, score)
 
     display: str = PAIR_DISPLAY_NAMES.get(symbol, symbol)
-    logger.info(
-        "→ Dispatching signal: [%s] %s | Entry=%.8f | TP=%.8f | SL=%.8f | RR=%.3f | Score=%+d",
-        display, direction, entry, tp, sl, rr, score,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "→ Dispatching signal: [%s] %s | Entry=%.8f | TP=%.8f | SL=%.8f | RR=%.3f | Score=%+d",
+            display, direction, entry, tp, sl, rr, score,
+        )
 
-    timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT_S)
-    _owns_session: bool = session is None
+    return await _deliver(session, webhook_url, json_body, display)
 
-    try:
-        if _owns_session:
-            session = aiohttp.ClientSession(headers=WEBHOOK_HEADERS)
 
-        async with session.post(  # type: ignore[union-attr]
+async def _deliver(
+    session: Optional[aiohttp.ClientSession],
+    webhook_url: str,
+    json_body: bytes,
+    display: str,
+) -> bool:
+    """Sends ``json_body`` behind the circuit breaker, retrying transient errors.
+
+    Args:
+        session:     Session to send through, or ``None`` for the fallback one.
+        webhook_url: Destination URL.
+        json_body:   UTF-8 JSON body.
+        display:     Display name used in log lines.
+
+    Returns:
+        ``True`` once the webhook answers 2xx, ``False`` otherwise.
+    """
+    breaker: _CircuitBreaker = _breaker_for(webhook_url)
+    if not breaker.allow_request():
+        logger.warning("Webhook circuit OPEN — dropping signal for [%s].", display)
+        return False
+
+    if session is None:
+        session = await _get_default_session()
+
+    delivered: bool = False
+    for attempt in range(MAX_RETRIES):
+        delivered, retryable = await _post_payload(session, webhook_url, json_body, display)
+        if delivered or not retryable or attempt == MAX_RETRIES - 1:
+            break
+        delay: float = random.uniform(0.0, min(_RETRY_CAP_S, _RETRY_BASE_S * 2 ** attempt))
+        logger.warning(
+            "Retrying webhook for [%s] in %.2fs (attempt %d/%d).",
+            display, delay, attempt + 2, MAX_RETRIES,
+        )
+        await asyncio.sleep(delay)
+
+    if delivered:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+    return delivered
+
+
+async def _post_payload(
+    session: aiohttp.ClientSession,
+    webhook_url: str,
+    json_body: bytes,
+    display: str,
+) -> tuple[bool, bool]:
+    """POSTs one encoded payload; logs the outcome and never raises.
+
+    Args:
+        session:     Session to send through (not closed here).
+        webhook_url: Destination URL.
+        json_body:   UTF-8 JSON body.
+        display:     Display name used in log lines.
+
+    Returns:
+        ``(delivered, retryable)``: ``delivered`` is ``True`` on HTTP 2xx;
+        ``retryable`` is ``True`` only for ``_RETRY_STATUSES`` and failures
+        before the request was sent. Only a 502/504 re-POST can duplicate a
+        signal (see ``_RETRY_STATUSES``).
+    """
+    try:
+        async with session.post(
             webhook_url,
             data=json_body,
             headers=WEBHOOK_HEADERS,
-            timeout=timeout,
+            timeout=_TIMEOUT,
         ) as response:
             if response.status < 300:
                 logger.info(
                     "✓ Webhook ACK %d for [%s].", response.status, display
                 )
-                return True
+                return True, False
             else:
                 error_body: str = await response.text()
                 logger.error(
                     "✗ Webhook NACK %d for [%s]: %s", response.status, display, error_body
                 )
-                return False
+                return False, response.status in _RETRY_STATUSES
 
-    except aiohttp.ServerTimeoutError:
+    # ServerTimeoutError is an asyncio.TimeoutError, as is the total timeout.
+    # The body may already have been handled, so neither is retried.
+    except asyncio.TimeoutError:
         logger.error("Webhook TIMEOUT for [%s] after %.1fs.", display, WEBHOOK_TIMEOUT_S)
-        return False
+        return False, False
+    # Connecting failed: nothing reached the receiver, safe to send again.
+    except aiohttp.ClientConnectorError as exc:
+        logger.error("Webhook CONNECT ERROR for [%s]: %s", display, exc)
+        return False, True
+    # Dropped after the request went out (e.g. ServerDisconnectedError).
     except aiohttp.ClientConnectionError as exc:
         logger.error("Webhook CONNECTION ERROR for [%s]: %s", display, exc)
-        return False
+        return False, False
     except aiohttp.ClientResponseError as exc:
         logger.error("Webhook RESPONSE ERROR for [%s]: %s", display, exc)
-        return False
+        return False, exc.status in _RETRY_STATUSES
     except Exception as exc:  # noqa: BLE001
         logger.exception("Unexpected webhook error for [%s]: %s", display, exc)
-        return False
-    finally:
-        if _owns_session and session is not None:
-            await session.close()
+        return False, False
+
+
+# ---------------------------------------------------------------------------
+# Background Dispatcher (bulkhead)
+# ---------------------------------------------------------------------------
+
+class SignalDispatcher:
+    """Delivers signals through ``send_signal`` on a fixed pool of workers.
+
+    ``enqueue_signal`` returns as soon as the signal is queued, so the
+    scanner never waits on webhook I/O (timeouts and retry back-off
+    included). At most ``workers`` POSTs are in flight at once; when the
+    queue is full new signals are logged and dropped rather than blocking.
+
+    Typical usage::
+
+        dispatcher = SignalDispatcher(session=http_session)
+        dispatcher.enqueue_signal(symbol, "LONG", entry, tp, sl, rr, score)
+        ...
+        await dispatcher.close()   # on shutdown, drains what is queued
+    """
+
+    def __init__(
+        self,
+        webhook_url: str = WEBHOOK_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        workers: int = DEFAULT_DISPATCH_WORKERS,
+        queue_size: int = DEFAULT_DISPATCH_QUEUE_SIZE,
+    ) -> None:
+        """Stores the destination; worker tasks start on first enqueue.
+
+        Args:
+            webhook_url: Destination URL. Defaults to ``config.WEBHOOK_URL``.
+            session:     Shared session to POST through; ``None`` uses the
+                         module fallback session.
+            workers:     Concurrent deliveries (the bulkhead size).
+            queue_size:  Signals held while all workers are busy.
+        """
+        self._webhook_url: str = webhook_url
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._n_workers: int = workers
+        self._queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+
+    def enqueue_signal(
+        self,
+        symbol: str,
+        direction: str,
+        entry: float,
+        tp: float,
+        sl: float,
+        rr: float,
+        score: int,
+    ) -> bool:
+        """Queues one signal for background delivery. Returns immediately.
+
+        Must be called from within a running event loop.
+
+        Args:
+            symbol:    ccxt trading symbol.
+            direction: ``"LONG"`` or ``"SHORT"``.
+            entry:     Entry price.
+            tp:        Take-profit price.
+            sl:        Stop-loss price.
+            rr:        Risk:Reward ratio.
+            score:     Signal score.
+
+        Returns:
+            ``True`` if queued, ``False`` if the queue was full and the
+            signal was dropped.
+        """
+        try:
+            self._queue.put_nowait((symbol, direction, entry, tp, sl, rr, score))
+        except asyncio.QueueFull:
+            logger.warning(
+                "Signal queue full (%d pending) — dropping [%s] %s signal.",
+                self._queue.maxsize, PAIR_DISPLAY_NAMES.get(symbol, symbol), direction,
+            )
+            return False
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker_loop(), name=f"webhook-dispatch:{i}")
+                for i in range(self._n_workers)
+            ]
+        return True
+
+    async def _worker_loop(self) -> None:
+        """Delivers queued signals one at a time, forever."""
+        while True:
+            args: tuple = await self._queue.get()
+            try:
+                await send_signal(*args, webhook_url=self._webhook_url, session=self._session)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Signal dispatch worker error: %s", exc)
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """Drains queued signals (up to ``DEFAULT_DISPATCH_CLOSE_TIMEOUT_S``) and stops.
+
+        Does not close the session passed to the constructor.
+        """
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), DEFAULT_DISPATCH_CLOSE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "SignalDispatcher: %d queued signals not sent before shutdown.",
+                self._queue.qsize(),
+            )
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+
+# ---------------------------------------------------------------------------
+# Batched Dispatcher
+# ---------------------------------------------------------------------------
+
+class SignalBatcher:
+    """Coalesces signals raised close together into one webhook POST.
+
+    ``enqueue_signal`` takes the same trade arguments as ``send_signal`` but
+    only queues the payload; a background task waits up to ``window_s``
+    after the first queued signal for more, then POSTs up to ``max_batch``
+    of them as one envelope::
+
+        {"schema_version": "1.1", "signals": [<build_signal_payload()>, ...]}
+
+    Delivery goes through the same circuit breaker and retry policy as
+    ``send_signal``. Callers that need a per-signal ACK, or a consumer that
+    only understands the single-signal ``"1.0"`` schema, should keep using
+    ``send_signal``.
+
+    Typical usage::
+
+        batcher = SignalBatcher(session=http_session)
+        batcher.enqueue_signal(symbol, "LONG", entry, tp, sl, rr, score)
+        ...
+        await batcher.close()   # on shutdown, flushes what is queued
+    """
+
+    def __init__(
+        self,
+        webhook_url: str = WEBHOOK_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        window_s: float = DEFAULT_BATCH_WINDOW_S,
+        max_batch: int = DEFAULT_BATCH_MAX,
+    ) -> None:
+        """Stores the destination; the background task starts on first enqueue.
+
+        Args:
+            webhook_url: Destination URL. Defaults to ``config.WEBHOOK_URL``.
+            session:     Shared session to POST through; ``None`` uses the
+                         module fallback session.
+            window_s:    Seconds the first queued signal waits for others.
+            max_batch:   Most signals sent in one POST.
+        """
+        self._webhook_url: str = webhook_url
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._window_s: float = window_s
+        self._max_batch: int = max_batch
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._sender_task: Optional[asyncio.Task[None]] = None
+
+    def enqueue_signal(
+        self,
+        symbol: str,
+        direction: str,
+        entry: float,
+        tp: float,
+        sl: float,
+        rr: float,
+        score: int,
+    ) -> None:
+        """Queues one signal for the next batch. Returns immediately.
+
+        Must be called from within a running event loop.
+
+        Args:
+            symbol:    ccxt trading symbol.
+            direction: ``"LONG"`` or ``"SHORT"``.
+            entry:     Entry price.
+            tp:        Take-profit price.
+            sl:        Stop-loss price.
+            rr:        Risk:Reward ratio.
+            score:     Signal score.
+        """
+        # Held privately until encoded, so the shared meta template is safe
+        self._queue.put_nowait(_assemble(symbol, direction, entry, tp, sl, rr, score))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "→ Queued signal: [%s] %s | Entry=%.8f | TP=%.8f | SL=%.8f | RR=%.3f | Score=%+d",
+                PAIR_DISPLAY_NAMES.get(symbol, symbol), direction, entry, tp, sl, rr, score,
+            )
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(
+                self._sender_loop(), name="webhook-batcher"
+            )
+
+    async def _sender_loop(self) -> None:
+        """Drains the queue forever, one POST per collected batch."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            signals: list[dict] = [await self._queue.get()]
+            deadline: float = loop.time() + self._window_s
+            while len(signals) < self._max_batch:
+                remaining: float = deadline - loop.time()
+                if remaining <= 0.0:
+                    break
+                try:
+                    signals.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._send_batch(signals)
+            finally:
+                for _ in signals:
+                    self._queue.task_done()
+
+    async def _send_batch(self, signals: list[dict]) -> bool:
+        """Encodes and delivers one envelope; never raises."""
+        json_body: bytes = orjson.dumps(
+            {"schema_version": "1.1", "signals": signals}, option=_JSON_OPTIONS
+        )
+        display: str = ", ".join(s["signal"]["pair"] for s in signals)
+        return await _deliver(self._session, self._webhook_url, json_body, display)
+
+    async def close(self) -> None:
+        """Flushes queued signals (up to ``DEFAULT_BATCH_CLOSE_TIMEOUT_S``) and stops.
+
+        Does not close the session passed to the constructor.
+        """
+        if self._sender_task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), DEFAULT_BATCH_CLOSE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "SignalBatcher: %d queued signals not sent before shutdown.",
+                self._queue.qsize(),
+            )
+        self._sender_task.cancel()
+        try:
+            await self._sender_task
+        except asyncio.CancelledError:
+            pass
+        self._sender_task = None
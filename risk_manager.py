@@ -17,7 +17,7 @@ Design Philosophy:
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Final, Optional
 
 import numpy as np
 import pandas as pd
@@ -25,11 +25,19 @@ import pandas as pd
 from config import (
     ATR_PERIOD,
     ATR_SL_MULTIPLIER,
-    HVN_PERCENTILE,
     MIN_RR_RATIO,
     SWING_LOOKBACK,
     VP_BINS,
+    VP_WINDOW,
 )
+from data_ingestion import Candles
+from volume_profile import hvn_threshold
+
+# Optional JIT accelerator for the fused feature kernel; NumPy path is used without it.
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -41,82 +49,287 @@ RiskParams = dict[str, float]
 # Internal Helpers
 # ---------------------------------------------------------------------------
 
-def _compute_atr(df: pd.DataFrame, period: int = ATR_PERIOD) -> float:
-    """Computes the latest ATR value from the DataFrame.
+def _compute_atr(candles: Candles, period: int = ATR_PERIOD) -> float:
+    """Computes the latest ATR value from the candle arrays.
 
     Args:
-        df: DataFrame with columns ``[high, low, close]``.
+        candles: Candle arrays (``high``, ``low``, ``close`` are read).
         period: Rolling ATR window size.
 
     Returns:
         Float ATR value of the most recent completed candle, or 0.0 if NaN.
     """
-    prev_close: pd.Series = df["close"].shift(1)
-    tr: pd.Series = pd.concat(
-        [
-            df["high"] - df["low"],
-            (df["high"] - prev_close).abs(),
-            (df["low"] - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-    atr_val: float = float(tr.rolling(period, min_periods=period).mean().iloc[-2])
+    close: np.ndarray = candles.close
+    n: int = close.shape[0]
+    if n < period + 1:
+        return 0.0
+
+    # Only the window ending on the last completed candle (index -2) matters,
+    # so TR is computed for those ``period`` candles alone.
+    start: int = n - period - 1
+    high: np.ndarray = candles.high[start:n - 1]
+    low: np.ndarray = candles.low[start:n - 1]
+    # First candle has no predecessor; using its own close reduces TR to H-L.
+    prev_close: np.ndarray = (
+        close[start - 1:n - 2] if start > 0 else np.concatenate((close[:1], close[:n - 2]))
+    )
+
+    tr: np.ndarray = high - low
+    np.maximum(tr, np.abs(high - prev_close), out=tr)
+    np.maximum(tr, np.abs(low - prev_close), out=tr)
+    atr_val: float = float(tr.mean())
     return atr_val if not np.isnan(atr_val) else 0.0
 
 
-def _get_hvn_levels(df: pd.DataFrame) -> np.ndarray:
+def _volume_profile(
+    close: np.ndarray, volume: np.ndarray, price_min: float, price_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bins close-price volume into ``VP_BINS`` equal-width price buckets.
+
+    Args:
+        close: Candle closes (float64).
+        volume: Candle volumes (float64).
+        price_min: Lower edge of the profile.
+        price_max: Upper edge of the profile (must exceed ``price_min``).
+
+    Returns:
+        ``(bin_mids, bin_volumes)`` float64 arrays of length ``VP_BINS``.
+    """
+    edges: np.ndarray = np.linspace(price_min, price_max, VP_BINS + 1)
+    mids: np.ndarray = (edges[:-1] + edges[1:]) / 2.0
+
+    # searchsorted(side="right") matches np.digitize on ascending edges.
+    indices: np.ndarray = np.clip(
+        np.searchsorted(edges, close, side="right") - 1, 0, VP_BINS - 1
+    )
+    vol_bins: np.ndarray = np.bincount(indices, weights=volume, minlength=VP_BINS)
+    return mids, vol_bins
+
+
+def _hvn_from_profile(mids: np.ndarray, vol_bins: np.ndarray) -> np.ndarray:
+    """Returns the bin mids whose volume reaches ``HVN_PERCENTILE``.
+
+    ``mids`` ascends with the bin edges, so the masked selection is already
+    sorted.
+    """
+    if vol_bins.size == 0:
+        return np.array([], dtype=np.float64)
+    return mids[vol_bins >= hvn_threshold(vol_bins)]
+
+
+def _get_hvn_levels(candles: Candles) -> np.ndarray:
     """Builds a coarse Volume Profile and returns High Volume Node price levels.
 
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        candles: Candle arrays (``high``, ``low``, ``close``, ``volume`` are read).
 
     Returns:
         Sorted ``np.ndarray`` of HVN price levels (ascending).
         Returns an empty array if price range is degenerate.
     """
-    price_min: float = float(df["low"].min())
-    price_max: float = float(df["high"].max())
+    price_min: float = float(candles.low.min())
+    price_max: float = float(candles.high.max())
 
     if price_max <= price_min:
         return np.array([], dtype=np.float64)
 
-    edges: np.ndarray = np.linspace(price_min, price_max, VP_BINS + 1)
+    mids, vol_bins = _volume_profile(candles.close, candles.volume, price_min, price_max)
+    return _hvn_from_profile(mids, vol_bins)
+
+
+def _get_swing_extremes(candles: Candles, lookback: int = SWING_LOOKBACK) -> tuple[float, float]:
+    """Returns the swing high and swing low over the recent lookback window.
+
+    Args:
+        candles: Candle arrays (``high``, ``low`` are read).
+        lookback: Number of candles to examine.
+
+    Returns:
+        ``(swing_high, swing_low)`` as floats.
+    """
+    return float(candles.high[-lookback:].max()), float(candles.low[-lookback:].min())
+
+
+def _risk_features_loop(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+    lookback: int,
+    vp_bins: int,
+    vp_window: int,
+) -> tuple[float, float, float, np.ndarray, np.ndarray]:
+    """Fused ATR / swing / volume-profile pass for JIT compilation.
+
+    Scalar kernel intended for ``_risk_features_jit``; semantics match
+    ``_compute_atr``, ``_get_swing_extremes`` and ``_volume_profile``.
+
+    Returns:
+        ``(atr, swing_high, swing_low, bin_mids, bin_volumes)``. The profile
+        arrays are empty when the price range is degenerate.
+    """
+    n: int = high.shape[0]
+    swing_start: int = max(n - lookback, 0)
+    vp_start: int = max(n - vp_window, 0)
+    atr_start: int = n - period - 1
+
+    tr_sum: float = 0.0
+    price_min: float = low[vp_start]
+    price_max: float = high[vp_start]
+    swing_high: float = high[swing_start]
+    swing_low: float = low[swing_start]
+    for i in range(n):
+        if i >= vp_start:
+            price_min = min(price_min, low[i])
+            price_max = max(price_max, high[i])
+        if i >= swing_start:
+            swing_high = max(swing_high, high[i])
+            swing_low = min(swing_low, low[i])
+        # ATR window ends on the last completed candle (index n - 2).
+        if atr_start >= 0 and atr_start <= i < n - 1:
+            prev_close = close[i - 1] if i > 0 else close[0]
+            tr_sum += max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    atr: float = tr_sum / period if atr_start >= 0 else 0.0
+
+    if price_max <= price_min:
+        empty: np.ndarray = np.zeros(0, dtype=np.float64)
+        return atr, swing_high, swing_low, empty, empty
+
+    edges: np.ndarray = np.linspace(price_min, price_max, vp_bins + 1)
     mids: np.ndarray = (edges[:-1] + edges[1:]) / 2.0
+    indices: np.ndarray = np.searchsorted(edges, close[vp_start:], "right") - 1
+    vol_bins: np.ndarray = np.zeros(vp_bins, dtype=np.float64)
+    for i in range(n - vp_start):
+        vol_bins[min(max(indices[i], 0), vp_bins - 1)] += volume[vp_start + i]
+    return atr, swing_high, swing_low, mids, vol_bins
 
-    indices: np.ndarray = np.clip(
-        np.digitize(df["close"].to_numpy(), edges) - 1, 0, VP_BINS - 1
+
+# Optional accelerator: JIT-compile the fused kernel when numba is present.
+if njit is not None:
+    _risk_features_jit = njit(cache=True)(_risk_features_loop)
+    # Compile (or load from cache) at import, not on the first live signal.
+    # Candle columns read off a frame are read-only, which numba types as a
+    # separate signature, so the warm-up buffer must be read-only too.
+    _warm: np.ndarray = np.ones(30, dtype=np.float64)
+    _warm.setflags(write=False)
+    _risk_features_jit(_warm, _warm, _warm, _warm, 14, 20, 10, 30)
+    del _warm
+else:
+    _risk_features_jit = None
+
+
+def _compute_risk_features(candles: Candles) -> tuple[float, np.ndarray, float, float]:
+    """Returns ``(atr, hvn_levels, swing_high, swing_low)`` for ``candles``.
+
+    Uses the fused numba kernel when available, otherwise the individual
+    NumPy helpers.
+
+    Args:
+        candles: Candle arrays (``high``, ``low``, ``close``, ``volume`` are read).
+
+    Returns:
+        ATR of the last completed candle (0.0 when undefined), the sorted HVN
+        levels over ``VP_WINDOW`` candles, and the swing high / low over
+        ``SWING_LOOKBACK`` candles.
+    """
+    if _risk_features_jit is None:
+        swing_high, swing_low = _get_swing_extremes(candles)
+        hvn_levels: np.ndarray = _get_hvn_levels(candles.tail(VP_WINDOW))
+        return _compute_atr(candles), hvn_levels, swing_high, swing_low
+
+    atr, swing_high, swing_low, mids, vol_bins = _risk_features_jit(
+        candles.high,
+        candles.low,
+        candles.close,
+        candles.volume,
+        ATR_PERIOD,
+        SWING_LOOKBACK,
+        VP_BINS,
+        VP_WINDOW,
     )
-    vol_bins: np.ndarray = np.zeros(VP_BINS, dtype=np.float64)
-    np.add.at(vol_bins, indices, df["volume"].to_numpy())
+    atr = atr if not np.isnan(atr) else 0.0
+    return atr, _hvn_from_profile(mids, vol_bins), swing_high, swing_low
 
-    threshold: float = float(np.percentile(vol_bins, HVN_PERCENTILE))
-    return np.sort(mids[vol_bins >= threshold])
 
+# Last feature set per symbol, keyed by the candles it came from:
+# symbol → ((candle count, last ts, last high, low, close, volume), features).
+# The live candle is part of the key because it still moves within its
+# timestamp; earlier candles are closed and fixed once that matches.
+_FEATURE_CACHE: dict[str, tuple[tuple, tuple[float, np.ndarray, float, float]]] = {}
 
-def _get_swing_extremes(df: pd.DataFrame, lookback: int = SWING_LOOKBACK) -> tuple[float, float]:
-    """Returns the swing high and swing low over the recent lookback window.
+
+def _risk_features(
+    candles: Candles, symbol: str = ""
+) -> tuple[float, np.ndarray, float, float]:
+    """``_compute_risk_features`` memoised per symbol on the last candle.
+
+    Re-evaluating the same bar (e.g. both directions, or a re-scan before
+    the live candle changes) is a dict lookup; any other input recomputes
+    and replaces the entry, so at most one set is held per symbol. HVN
+    arrays are returned read-only because they are shared between calls.
 
     Args:
-        df: DataFrame with columns ``[high, low]``.
-        lookback: Number of candles to examine.
+        candles: Candle arrays (``high``, ``low``, ``close``, ``volume`` are read).
+        symbol: Cache key; an empty string disables memoisation.
 
     Returns:
-        ``(swing_high, swing_low)`` as floats.
+        Same as ``_compute_risk_features``.
     """
-    window: pd.DataFrame = df.iloc[-lookback:]
-    return float(window["high"].max()), float(window["low"].min())
+    if not symbol:
+        return _compute_risk_features(candles)
+
+    key: tuple = (
+        candles.size,
+        int(candles.ts[-1]),
+        float(candles.high[-1]),
+        float(candles.low[-1]),
+        float(candles.close[-1]),
+        float(candles.volume[-1]),
+    )
+    cached = _FEATURE_CACHE.get(symbol)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    features: tuple[float, np.ndarray, float, float] = _compute_risk_features(candles)
+    features[1].setflags(write=False)
+    _FEATURE_CACHE[symbol] = (key, features)
+    return features
 
 
 def _find_nearest_above(levels: np.ndarray, price: float) -> Optional[float]:
-    """Returns the closest level strictly above ``price``, or ``None``."""
-    above: np.ndarray = levels[levels > price]
-    return float(above[0]) if above.size > 0 else None
+    """Returns the closest level strictly above ``price``, or ``None``.
+
+    ``levels`` must be sorted ascending (as returned by ``_get_hvn_levels``).
+    """
+    i: int = int(np.searchsorted(levels, price, side="right"))
+    return float(levels[i]) if i < levels.size else None
 
 
 def _find_nearest_below(levels: np.ndarray, price: float) -> Optional[float]:
-    """Returns the closest level strictly below ``price``, or ``None``."""
-    below: np.ndarray = levels[levels < price]
-    return float(below[-1]) if below.size > 0 else None
+    """Returns the closest level strictly below ``price``, or ``None``.
+
+    ``levels`` must be sorted ascending (as returned by ``_get_hvn_levels``).
+    """
+    i: int = int(np.searchsorted(levels, price, side="left")) - 1
+    return float(levels[i]) if i >= 0 else None
+
+
+# Present in fetched frames but not needed by the risk calculations.
+_TAKER_COLUMNS: Final[tuple[str, ...]] = ("taker_buy_volume", "taker_sell_volume")
+
+
+def _frame_view(df: pd.DataFrame) -> Candles:
+    """``Candles`` view of an OHLCV frame; the taker columns are optional.
+
+    The risk manager never reads taker volume, so a frame with only
+    ``[open, high, low, close, volume]`` gets NaN placeholders for them
+    instead of failing in ``Candles.from_frame``.
+    """
+    missing: list[str] = [col for col in _TAKER_COLUMNS if col not in df.columns]
+    if missing:
+        df = df.assign(**{col: np.nan for col in missing})
+    return Candles.from_frame(df)
 
 
 # ---------------------------------------------------------------------------
@@ -124,9 +337,10 @@ def _find_nearest_below(levels: np.ndarray, price: float) -> Optional[float]:
 # ---------------------------------------------------------------------------
 
 def calculate_risk_params(
-    df: pd.DataFrame,
+    df: pd.DataFrame | Candles,
     direction: str,
     atr_multiplier_sl: float = ATR_SL_MULTIPLIER,
+    symbol: str = "",
 ) -> Optional[RiskParams]:
     """Calculates dynamic TP and SL anchored to liquidity structure.
 
@@ -147,17 +361,24 @@ def calculate_risk_params(
 
     Args:
         df: Clean OHLCV DataFrame with columns
-            ``[open, high, low, close, volume]``.
+            ``[open, high, low, close, volume]``, or the equivalent
+            ``Candles`` arrays (used as-is, with no conversion).
             Minimum of ``ATR_PERIOD + SWING_LOOKBACK`` rows required.
         direction: ``"LONG"`` or ``"SHORT"``.
         atr_multiplier_sl: Multiplier applied to ATR for SL padding.
             Defaults to ``config.ATR_SL_MULTIPLIER``.
+        symbol: Optional ccxt symbol; when given, ATR / HVN / swing features
+            are memoised per symbol so repeat calls on the same bar are free.
 
     Returns:
         A ``RiskParams`` dict ``{"Entry": float, "SL": float, "TP": float, "RR": float}``
         if the trade passes validation, otherwise ``None``.
     """
-    if df is None or df.empty:
+    if df is None:
+        logger.debug("Risk Manager: Empty DataFrame supplied.")
+        return None
+    candles: Candles = df if isinstance(df, Candles) else _frame_view(df)
+    if candles.size == 0:
         logger.debug("Risk Manager: Empty DataFrame supplied.")
         return None
 
@@ -165,12 +386,12 @@ def calculate_risk_params(
         logger.error("Risk Manager: Invalid direction '%s'. Must be LONG or SHORT.", direction)
         return None
 
-    entry: float = float(df["close"].iloc[-1])
-    atr: float = _compute_atr(df)
-    sl_buffer: float = atr * atr_multiplier_sl
+    entry: float = float(candles.close[-1])
 
-    hvn_levels: np.ndarray = _get_hvn_levels(df)
-    swing_high, swing_low = _get_swing_extremes(df)
+    # ATR needs one extra leading row for the previous close of its first TR.
+    tail: Candles = candles.tail(max(ATR_PERIOD + 2, SWING_LOOKBACK, VP_WINDOW))
+    atr, hvn_levels, swing_high, swing_low = _risk_features(tail, symbol)
+    sl_buffer: float = atr * atr_multiplier_sl
 
     sl: Optional[float] = None
     tp: Optional[float] = None
@@ -204,39 +425,48 @@ def calculate_risk_params(
         logger.debug("Risk Manager: SL or TP could not be determined.")
         return None
 
+    # Most candidates are rejected below, so argument packing for the debug
+    # lines is skipped unless DEBUG is actually enabled.
+    debug: bool = logger.isEnabledFor(logging.DEBUG)
+
     if direction == "LONG" and (sl >= entry or tp <= entry):
-        logger.debug(
-            "Risk Manager: Invalid LONG geometry — entry=%.6f, SL=%.6f, TP=%.6f.",
-            entry, sl, tp,
-        )
+        if debug:
+            logger.debug(
+                "Risk Manager: Invalid LONG geometry — entry=%.6f, SL=%.6f, TP=%.6f.",
+                entry, sl, tp,
+            )
         return None
 
     if direction == "SHORT" and (sl <= entry or tp >= entry):
-        logger.debug(
-            "Risk Manager: Invalid SHORT geometry — entry=%.6f, SL=%.6f, TP=%.6f.",
-            entry, sl, tp,
-        )
+        if debug:
+            logger.debug(
+                "Risk Manager: Invalid SHORT geometry — entry=%.6f, SL=%.6f, TP=%.6f.",
+                entry, sl, tp,
+            )
         return None
 
     risk: float = abs(entry - sl)
     reward: float = abs(tp - entry)
 
     if risk <= 0.0:
-        logger.debug("Risk Manager: Zero or negative risk (SL=%.6f, Entry=%.6f).", sl, entry)
+        if debug:
+            logger.debug("Risk Manager: Zero or negative risk (SL=%.6f, Entry=%.6f).", sl, entry)
         return None
 
     rr: float = round(reward / risk, 3)
 
     if rr < MIN_RR_RATIO:
-        logger.debug(
-            "Risk Manager: RR=%.3f < MIN_RR=%.1f. Signal REJECTED.", rr, MIN_RR_RATIO
-        )
+        if debug:
+            logger.debug(
+                "Risk Manager: RR=%.3f < MIN_RR=%.1f. Signal REJECTED.", rr, MIN_RR_RATIO
+            )
         return None
 
-    logger.debug(
-        "Risk Manager: %s APPROVED — Entry=%.6f | SL=%.6f | TP=%.6f | RR=%.3f.",
-        direction, entry, sl, tp, rr,
-    )
+    if debug:
+        logger.debug(
+            "Risk Manager: %s APPROVED — Entry=%.6f | SL=%.6f | TP=%.6f | RR=%.3f.",
+            direction, entry, sl, tp, rr,
+        )
 
     return {
         "Entry": round(entry, 8),
@@ -19,20 +19,22 @@ Conditions:
     4. Momentum — 5-candle Rate-of-Change combined with L2 orderbook clearance.
     5. Liquidity— Volume Profile HVN zone interaction & Swing H/L sweep detection.
 
-All calculations are fully vectorised using NumPy and Pandas.
+All calculations are fully vectorised using NumPy. Callers may pass the
+``Candles`` arrays they already hold; each call gathers them (plus OFI) once
+into a :class:`_ScoringCache` that every condition shares.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Final, Optional
 
 import numpy as np
 import pandas as pd
 
 from config import (
     CVD_WINDOW,
-    HVN_PERCENTILE,
     HVN_PROXIMITY_PCT,
     MOMENTUM_ROC_PERIOD,
     OB_IMBALANCE_FACTOR,
@@ -40,6 +42,14 @@ from config import (
     OFI_WINDOW,
     VP_BINS,
 )
+from data_ingestion import Candles, OrderBook
+from volume_profile import hvn_threshold
+
+# Optional JIT accelerator for the vote kernel; NumPy path is used without it.
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -48,114 +58,225 @@ logger = logging.getLogger(__name__)
 # Shared Internal Helpers
 # ---------------------------------------------------------------------------
 
-def _compute_ofi(df: pd.DataFrame) -> pd.Series:
-    """Computes per-candle Order Flow Imbalance (OFI).
+@dataclass
+class _ScoringCache:
+    """Column arrays shared by the condition scorers of one ``compute_score`` call.
+
+    Attributes:
+        ofi:    Per-candle Order Flow Imbalance (Taker Buy - Taker Sell volume).
+                Positive → net aggressive buying, negative → net selling.
+        high:   ``high`` column.
+        low:    ``low`` column.
+        close:  ``close`` column.
+        volume: ``volume`` column.
+        last_ts: Open time of the last candle (``Candles.ts``, int64 ns).
+    """
+    ofi: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    last_ts: int
+
 
-    OFI = Taker Buy Volume - Taker Sell Volume.
-    Positive → net aggressive buying pressure.
-    Negative → net aggressive selling pressure.
+def _build_scoring_cache(candles: Candles) -> _ScoringCache:
+    """Collects the scoring columns and derives OFI once.
 
     Args:
-        df: DataFrame with columns ``[taker_buy_volume, taker_sell_volume]``.
+        candles: Candle arrays (``taker_buy``, ``taker_sell``, ``high``,
+            ``low``, ``close``, ``volume`` and ``ts`` are read).
 
     Returns:
-        A ``pd.Series`` of OFI values aligned to ``df.index``.
+        A populated :class:`_ScoringCache`; the price arrays are views.
     """
-    return df["taker_buy_volume"] - df["taker_sell_volume"]
+    return _ScoringCache(
+        ofi=candles.taker_buy - candles.taker_sell,
+        high=candles.high,
+        low=candles.low,
+        close=candles.close,
+        volume=candles.volume,
+        last_ts=int(candles.ts[-1]),
+    )
 
 
-def _compute_vwap(df: pd.DataFrame) -> pd.Series:
-    """Computes session VWAP using cumulative typical price × volume.
+def _vwap_last(cache: _ScoringCache) -> float:
+    """Computes the session VWAP as of the last candle.
 
     VWAP = Σ(Typical_Price × Volume) / Σ(Volume)
     where Typical_Price = (High + Low + Close) / 3
 
+    Only the final value is scored, so this is a single dot product rather
+    than two cumulative sums over the window.
+
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        cache: Column arrays of the scored window.
 
     Returns:
-        A ``pd.Series`` of VWAP values aligned to ``df.index``.
+        The VWAP, or ``NaN`` when the window has no volume.
     """
-    typical_price: pd.Series = (df["high"] + df["low"] + df["close"]) / 3.0
-    cum_tp_vol: pd.Series = (typical_price * df["volume"]).cumsum()
-    cum_vol: pd.Series = df["volume"].cumsum()
-    # Guard against division by zero on the first candle
-    return cum_tp_vol / cum_vol.replace(0, np.nan)
+    typical_price: np.ndarray = (cache.high + cache.low + cache.close) / 3.0
+    total_vol: float = float(cache.volume.sum())
+    if total_vol == 0:
+        return float("nan")
+    return float(np.dot(typical_price, cache.volume)) / total_vol
 
 
-def _build_volume_profile(df: pd.DataFrame) -> pd.DataFrame:
-    """Builds a coarse price-volume histogram over the full DataFrame.
+def _vol_profile_loop(close: np.ndarray, volume: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Bins ``volume`` by ``close`` against ascending ``edges`` in one pass.
+
+    Scalar loop intended for ``_vol_profile_jit``; semantics match the
+    searchsorted + clip + bincount chain in ``_build_volume_profile``
+    (same bin per close, same accumulation order), without the temporary
+    index array.
+    """
+    nbins: int = edges.shape[0] - 1
+    vol_bins: np.ndarray = np.zeros(nbins, dtype=np.float64)
+    for i in range(close.shape[0]):
+        idx: int = np.searchsorted(edges, close[i], side="right") - 1
+        if idx < 0:
+            idx = 0
+        elif idx >= nbins:
+            idx = nbins - 1
+        vol_bins[idx] += volume[i]
+    return vol_bins
+
+
+# Optional accelerator: JIT-compile the binning loop when numba is present
+# (warmed at import together with the vote kernel further down).
+_vol_profile_jit = njit(cache=True)(_vol_profile_loop) if njit is not None else None
+
+
+def _build_volume_profile(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Builds a coarse price-volume histogram over the full window.
 
     Each candle's volume is assigned to the bin containing its close price.
     The result approximates a market profile / footprint chart in O(n) time.
 
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        high: ``high`` column.
+        low: ``low`` column.
+        close: ``close`` column.
+        volume: ``volume`` column.
 
     Returns:
-        A DataFrame with columns ``[price_mid, volume]``,
-        sorted ascending by ``price_mid``.
+        ``(price_mid, volume)`` float64 arrays, ascending by ``price_mid``.
+        Both are empty when the window has no price range.
     """
-    price_min: float = float(df["low"].min())
-    price_max: float = float(df["high"].max())
+    price_min: float = float(low.min())
+    price_max: float = float(high.max())
 
     if price_max <= price_min:
-        return pd.DataFrame({"price_mid": [], "volume": []})
+        empty: np.ndarray = np.array([], dtype=np.float64)
+        return empty, empty
 
     edges: np.ndarray = np.linspace(price_min, price_max, VP_BINS + 1)
     mids: np.ndarray = (edges[:-1] + edges[1:]) / 2.0
 
-    # Vectorised bin assignment — no Python loops
+    if _vol_profile_jit is not None:
+        return mids, _vol_profile_jit(close, volume, edges)
+
+    # Vectorised bin assignment — no Python loops. searchsorted(side="right")
+    # matches np.digitize on ascending edges; bincount replaces the
+    # unbuffered np.add.at scatter with a single C pass.
     indices: np.ndarray = np.clip(
-        np.digitize(df["close"].to_numpy(), edges) - 1, 0, VP_BINS - 1
+        np.searchsorted(edges, close, side="right") - 1, 0, VP_BINS - 1
     )
-    vol_bins: np.ndarray = np.zeros(VP_BINS, dtype=np.float64)
-    np.add.at(vol_bins, indices, df["volume"].to_numpy())
+    vol_bins: np.ndarray = np.bincount(indices, weights=volume, minlength=VP_BINS)
 
-    return pd.DataFrame({"price_mid": mids, "volume": vol_bins})
+    return mids, vol_bins
 
 
-def _get_hvn_levels(df: pd.DataFrame) -> np.ndarray:
+def _get_hvn_levels(cache: _ScoringCache) -> np.ndarray:
     """Returns price levels classified as High Volume Nodes (HVNs).
 
     An HVN is a price bin whose accumulated volume exceeds the
     ``HVN_PERCENTILE``-th percentile of all bins.
 
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        cache: Column arrays of the scored window.
 
     Returns:
         Sorted ``np.ndarray`` of HVN price levels (ascending).
     """
-    vp: pd.DataFrame = _build_volume_profile(df)
-    if vp.empty:
-        return np.array([], dtype=np.float64)
+    mids, vol_bins = _build_volume_profile(
+        cache.high, cache.low, cache.close, cache.volume
+    )
+    if vol_bins.size == 0:
+        return mids
+
+    threshold: float = hvn_threshold(vol_bins)
+    # mids ascend by construction and the mask keeps their order.
+    return mids[vol_bins >= threshold]
+
 
-    threshold: float = float(np.percentile(vp["volume"].to_numpy(), HVN_PERCENTILE))
-    hvn_mask: np.ndarray = vp["volume"].to_numpy() >= threshold
-    return np.sort(vp.loc[hvn_mask, "price_mid"].to_numpy())
+# Last HVN levels per symbol, keyed by the window they came from:
+# symbol → ((candle count, last ts, last high, low, close, volume), levels).
+# Same fingerprint and replacement policy as risk_manager._FEATURE_CACHE.
+_HVN_CACHE: dict[str, tuple[tuple, np.ndarray]] = {}
+
+
+def _hvn_levels(cache: _ScoringCache, symbol: str = "") -> np.ndarray:
+    """``_get_hvn_levels`` memoised per symbol on the last candle.
+
+    A re-scan before the live candle changes is a dict lookup; any other
+    window recomputes and replaces the entry, so at most one array is held
+    per symbol. Cached arrays are read-only because they are shared.
+
+    The profile is not updated incrementally: a new candle can move the
+    window's low/high and with it every bin edge.
+
+    Args:
+        cache: Column arrays of the scored window.
+        symbol: Cache key; an empty string disables memoisation.
+
+    Returns:
+        Same as ``_get_hvn_levels``.
+    """
+    if not symbol:
+        return _get_hvn_levels(cache)
+
+    key: tuple = (
+        cache.close.size,
+        cache.last_ts,
+        float(cache.high[-1]),
+        float(cache.low[-1]),
+        float(cache.close[-1]),
+        float(cache.volume[-1]),
+    )
+    cached = _HVN_CACHE.get(symbol)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    levels: np.ndarray = _get_hvn_levels(cache)
+    levels.setflags(write=False)
+    _HVN_CACHE[symbol] = (key, levels)
+    return levels
 
 
 # ---------------------------------------------------------------------------
 # Condition 1: OFI
 # ---------------------------------------------------------------------------
 
-def _score_ofi(df: pd.DataFrame) -> int:
+def _score_ofi(ofi: np.ndarray) -> int:
     """Condition 1: Rolling Order Flow Imbalance.
 
-    Computes a smoothed OFI by rolling-averaging the last ``OFI_WINDOW``
-    candles. A positive mean indicates sustained aggressive buying pressure.
+    Computes a smoothed OFI by averaging the last ``OFI_WINDOW`` candles
+    (fewer if the history is shorter). A positive mean indicates sustained
+    aggressive buying pressure.
 
     Args:
-        df: DataFrame with taker-volume columns.
+        ofi: Per-candle OFI array from :class:`_ScoringCache`.
 
     Returns:
         ``+1`` if net buying pressure, ``-1`` if net selling, ``0`` if flat.
     """
-    ofi: pd.Series = _compute_ofi(df)
-    rolling_ofi: float = float(
-        ofi.rolling(OFI_WINDOW, min_periods=1).mean().iloc[-1]
-    )
+    tail: np.ndarray = ofi[-OFI_WINDOW:]
+    rolling_ofi: float = float(tail.mean()) if tail.size else 0.0
 
     if rolling_ofi > 0:
         return 1
@@ -168,30 +289,33 @@ def _score_ofi(df: pd.DataFrame) -> int:
 # Condition 2: CVD Trend
 # ---------------------------------------------------------------------------
 
-def _score_cvd_trend(df: pd.DataFrame) -> int:
+def _score_cvd_trend(ofi: np.ndarray) -> int:
     """Condition 2: Cumulative Volume Delta (CVD) slope.
 
-    CVD is the rolling sum of OFI. We measure its slope by comparing the
-    latest CVD value to the value at the midpoint of the rolling window.
-    A rising CVD confirms sustained accumulation; a falling CVD confirms
-    sustained distribution.
+    CVD is the rolling ``CVD_WINDOW`` sum of OFI. We measure its slope by
+    comparing the latest CVD value to the value at the midpoint of the
+    rolling window. A rising CVD confirms sustained accumulation; a falling
+    CVD confirms sustained distribution.
+
+    Only the two CVD points are needed, so each is summed directly from its
+    OFI window instead of materialising the whole rolling series.
 
     Args:
-        df: DataFrame with taker-volume columns.
+        ofi: Per-candle OFI array from :class:`_ScoringCache`.
 
     Returns:
         ``+1`` if CVD is rising, ``-1`` if falling, ``0`` if flat.
     """
-    ofi: pd.Series = _compute_ofi(df)
-    cvd: pd.Series = ofi.rolling(CVD_WINDOW, min_periods=1).sum()
-
-    if len(cvd) < 2:
+    n: int = ofi.size
+    if n < 2:
         return 0
 
     # Compare the tail to the midpoint of the CVD window
     mid_offset: int = max(1, CVD_WINDOW // 2)
-    mid_idx: int = max(0, len(cvd) - mid_offset - 1)
-    slope: float = float(cvd.iloc[-1]) - float(cvd.iloc[mid_idx])
+    mid_idx: int = max(0, n - mid_offset - 1)
+    cvd_last: float = float(ofi[-CVD_WINDOW:].sum())
+    cvd_mid: float = float(ofi[max(0, mid_idx - CVD_WINDOW + 1):mid_idx + 1].sum())
+    slope: float = cvd_last - cvd_mid
 
     if slope > 0:
         return 1
@@ -204,7 +328,7 @@ def _score_cvd_trend(df: pd.DataFrame) -> int:
 # Condition 3: VWAP Premium / Discount
 # ---------------------------------------------------------------------------
 
-def _score_vwap(df: pd.DataFrame) -> int:
+def _score_vwap(cache: _ScoringCache) -> int:
     """Condition 3: VWAP Premium or Discount.
 
     If price is trading *above* VWAP → institutions are paying premium,
@@ -212,14 +336,13 @@ def _score_vwap(df: pd.DataFrame) -> int:
     If price is *below* VWAP → selling at discount, bearish bias (score -1).
 
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        cache: Column arrays of the scored window.
 
     Returns:
         ``+1`` if close > VWAP, ``-1`` if close < VWAP, ``0`` if equal.
     """
-    vwap: pd.Series = _compute_vwap(df)
-    current_close: float = float(df["close"].iloc[-1])
-    current_vwap: float = float(vwap.iloc[-1])
+    current_close: float = float(cache.close[-1])
+    current_vwap: float = _vwap_last(cache)
 
     if np.isnan(current_vwap):
         return 0
@@ -234,7 +357,30 @@ def _score_vwap(df: pd.DataFrame) -> int:
 # Condition 4: Momentum + Orderbook Clearance
 # ---------------------------------------------------------------------------
 
-def _score_momentum_and_orderbook(df: pd.DataFrame, orderbook: dict) -> int:
+def _momentum_sign(close: np.ndarray) -> int:
+    """Sign of the ``MOMENTUM_ROC_PERIOD``-candle Rate-of-Change (0 if too short).
+
+    Args:
+        close: ``close`` column from :class:`_ScoringCache`.
+
+    Returns:
+        ``+1`` for a positive ROC, ``-1`` for a negative one, else ``0``.
+    """
+    if close.size < MOMENTUM_ROC_PERIOD + 1:
+        return 0
+    close_now: float = float(close[-1])
+    close_ago: float = float(close[-(MOMENTUM_ROC_PERIOD + 1)])
+    roc: float = (close_now - close_ago) / (close_ago + 1e-12)
+    if roc > 0:
+        return 1
+    if roc < 0:
+        return -1
+    return 0
+
+
+def _score_momentum_and_orderbook(
+    momentum_score: int, orderbook: Optional[OrderBook]
+) -> int:
     """Condition 4: Price momentum combined with L2 orderbook depth clearance.
 
     Two sub-components, both must agree for a non-zero score:
@@ -249,46 +395,35 @@ def _score_momentum_and_orderbook(df: pd.DataFrame, orderbook: dict) -> int:
         the path upward is considered clear (and vice versa).
 
     Args:
-        df: DataFrame with column ``[close]``.
-        orderbook: Dict ``{"bids": [[price, size], ...], "asks": [...]}``
+        momentum_score: ROC sign from :func:`_momentum_sign` (or the kernel).
+        orderbook: L2 snapshot, or ``None`` (the book then scores 0).
 
     Returns:
         ``+1`` if momentum and book both lean bullish.
         ``-1`` if both lean bearish.
         ``0`` if signals are mixed or data is missing.
     """
-    # --- Momentum (vectorised ROC) ---
-    momentum_score: int = 0
-    if len(df) >= MOMENTUM_ROC_PERIOD + 1:
-        close_now: float = float(df["close"].iloc[-1])
-        close_ago: float = float(df["close"].iloc[-(MOMENTUM_ROC_PERIOD + 1)])
-        roc: float = (close_now - close_ago) / (close_ago + 1e-12)
-        if roc > 0:
-            momentum_score = 1
-        elif roc < 0:
-            momentum_score = -1
-
     # --- Orderbook Clearance (vectorised slicing) ---
     book_score: int = 0
-    bids_raw: list = orderbook.get("bids", []) if orderbook else []
-    asks_raw: list = orderbook.get("asks", []) if orderbook else []
-
-    if bids_raw and asks_raw:
-        bids: np.ndarray = np.asarray(bids_raw, dtype=np.float64)
-        asks: np.ndarray = np.asarray(asks_raw, dtype=np.float64)
-
-        if bids.ndim == 2 and asks.ndim == 2:
-            mid: float = (bids[0, 0] + asks[0, 0]) / 2.0
-            lower: float = mid * (1.0 - OB_PROXIMITY_PCT)
-            upper: float = mid * (1.0 + OB_PROXIMITY_PCT)
-
-            bid_liq: float = bids[bids[:, 0] >= lower, 1].sum()
-            ask_liq: float = asks[asks[:, 0] <= upper, 1].sum()
 
-            if bid_liq > ask_liq * OB_IMBALANCE_FACTOR:
-                book_score = 1
-            elif ask_liq > bid_liq * OB_IMBALANCE_FACTOR:
-                book_score = -1
+    if orderbook is not None and orderbook.bid_prices.size and orderbook.ask_prices.size:
+        bid_prices: np.ndarray = orderbook.bid_prices
+        ask_prices: np.ndarray = orderbook.ask_prices
+        mid: float = (bid_prices[0] + ask_prices[0]) / 2.0
+        lower: float = mid * (1.0 - OB_PROXIMITY_PCT)
+        upper: float = mid * (1.0 + OB_PROXIMITY_PCT)
+
+        # Bids descend and asks ascend (fetch_orderbook contract), so the
+        # levels in range form a prefix on each side: binary-search its end.
+        bid_cut: int = int(np.searchsorted(-bid_prices, -lower, side="right"))
+        ask_cut: int = int(np.searchsorted(ask_prices, upper, side="right"))
+        bid_liq: float = orderbook.bid_sizes[:bid_cut].sum()
+        ask_liq: float = orderbook.ask_sizes[:ask_cut].sum()
+
+        if bid_liq > ask_liq * OB_IMBALANCE_FACTOR:
+            book_score = 1
+        elif ask_liq > bid_liq * OB_IMBALANCE_FACTOR:
+            book_score = -1
 
     # Require both sub-components to agree
     if momentum_score == 1 and book_score >= 0:
@@ -302,7 +437,38 @@ def _score_momentum_and_orderbook(df: pd.DataFrame, orderbook: dict) -> int:
 # Condition 5: Liquidity Zones
 # ---------------------------------------------------------------------------
 
-def _score_liquidity_zones(df: pd.DataFrame) -> int:
+_LIQUIDITY_MIN_ROWS: Final[int] = 22
+_SWEEP_LOOKBACK: Final[int] = 20
+
+
+def _sweep_sign(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, lookback: int
+) -> int:
+    """Swing sweep on the last candle against the prior ``lookback`` candles.
+
+    Args:
+        high: ``high`` column.
+        low: ``low`` column.
+        close: ``close`` column (at least ``lookback + 1`` entries).
+        lookback: Candles before the last one that define the swing range.
+
+    Returns:
+        ``-1`` for a swing-high sweep, ``+1`` for a swing-low sweep, else ``0``.
+    """
+    current_close: float = float(close[-1])
+
+    # Swing extremes from the prior window (exclude the last candle itself)
+    swing_high: float = float(high[-(lookback + 1):-1].max())
+    swing_low: float = float(low[-(lookback + 1):-1].min())
+
+    if float(high[-1]) > swing_high and current_close < swing_high:
+        return -1
+    if float(low[-1]) < swing_low and current_close > swing_low:
+        return 1
+    return 0
+
+
+def _score_liquidity_zones(cache: _ScoringCache, sweep: int, symbol: str = "") -> int:
     """Condition 5: Volume Profile HVN interaction & Swing H/L sweep detection.
 
     Two sub-components evaluated in priority order:
@@ -319,34 +485,27 @@ def _score_liquidity_zones(df: pd.DataFrame) -> int:
         If price is below that HVN → resistance (``-1``).
 
     Args:
-        df: DataFrame with columns ``[high, low, close, volume]``.
+        cache: Column arrays of the scored window.
+        sweep: :func:`_sweep_sign` over ``_SWEEP_LOOKBACK`` (or the kernel's).
+        symbol: HVN cache key (see :func:`_hvn_levels`); empty disables it.
 
     Returns:
         ``+1``, ``-1``, or ``0`` based on the detected liquidity condition.
     """
-    min_rows: int = 22
-    if len(df) < min_rows:
+    if cache.close.size < _LIQUIDITY_MIN_ROWS:
         return 0
 
-    last: pd.Series = df.iloc[-1]
-    current_close: float = float(last["close"])
-    lookback: int = 20
-
-    # Swing extremes from the prior window (exclude the last candle itself)
-    prior: pd.DataFrame = df.iloc[-(lookback + 1):-1]
-    swing_high: float = float(prior["high"].max())
-    swing_low: float = float(prior["low"].min())
-
     # --- Sweep Detection ---
-    if float(last["high"]) > swing_high and current_close < swing_high:
+    if sweep < 0:
         logger.debug("Liquidity: Bearish swing-high sweep detected.")
         return -1
-    if float(last["low"]) < swing_low and current_close > swing_low:
+    if sweep > 0:
         logger.debug("Liquidity: Bullish swing-low sweep detected.")
         return 1
 
     # --- HVN Zone Interaction ---
-    hvn_levels: np.ndarray = _get_hvn_levels(df)
+    current_close: float = float(cache.close[-1])
+    hvn_levels: np.ndarray = _hvn_levels(cache, symbol)
     if hvn_levels.size == 0:
         return 0
 
@@ -366,13 +525,149 @@ def _score_liquidity_zones(df: pd.DataFrame) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Fused Kernel: Conditions 1-3, Momentum and Swing Sweep
+# ---------------------------------------------------------------------------
+
+def _sign(x: float) -> int:
+    if x > 0:
+        return 1
+    if x < 0:
+        return -1
+    return 0
+
+
+def _condition_votes_loop(
+    ofi: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    ofi_window: int,
+    cvd_window: int,
+    mom_period: int,
+    sweep_lookback: int,
+) -> tuple[int, int, int, int, int]:
+    """OFI, CVD, VWAP, momentum and sweep votes in one pass over the rows.
+
+    Scalar kernel intended for ``_condition_votes_jit``; semantics match
+    ``_score_ofi``, ``_score_cvd_trend``, ``_score_vwap``, ``_momentum_sign``
+    and ``_sweep_sign``. Each row is read once: every window is a suffix
+    or a range of the same forward loop that feeds the VWAP sums. Window
+    sums accumulate sequentially, so they may differ from NumPy's pairwise
+    sums in the last ulp.
+    """
+    n: int = close.shape[0]
+    last: int = n - 1
+
+    ofi_start: int = max(0, n - ofi_window)
+    cvd_start: int = max(0, n - cvd_window)
+    mid_idx: int = max(0, n - max(1, cvd_window // 2) - 1)
+    mid_start: int = max(0, mid_idx - cvd_window + 1)
+    swing_start: int = n - sweep_lookback - 1
+
+    cum_tp_vol: float = 0.0
+    cum_vol: float = 0.0
+    ofi_sum: float = 0.0
+    cvd_last: float = 0.0
+    cvd_mid: float = 0.0
+    swing_high: float = -np.inf
+    swing_low: float = np.inf
+
+    for i in range(n):
+        cum_tp_vol += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+        cum_vol += volume[i]
+        if i >= ofi_start:
+            ofi_sum += ofi[i]
+        if i >= cvd_start:
+            cvd_last += ofi[i]
+        if mid_start <= i <= mid_idx:
+            cvd_mid += ofi[i]
+        if swing_start <= i < last:
+            if high[i] > swing_high:
+                swing_high = high[i]
+            if low[i] < swing_low:
+                swing_low = low[i]
+
+    # Condition 1: mean OFI over the last ofi_window candles
+    c1: int = _sign(ofi_sum / (n - ofi_start)) if n > ofi_start else 0
+
+    # Condition 2: CVD at the tail vs the window midpoint
+    c2: int = _sign(cvd_last - cvd_mid) if n >= 2 else 0
+
+    # Condition 3: close vs session VWAP
+    c3: int = 0
+    if n > 0 and cum_vol != 0:
+        c3 = _sign(close[last] - cum_tp_vol / cum_vol)
+
+    # Condition 4 (momentum half): ROC sign
+    mom: int = 0
+    if n >= mom_period + 1:
+        close_ago: float = close[n - mom_period - 1]
+        mom = _sign((close[last] - close_ago) / (close_ago + 1e-12))
+
+    # Condition 5 (sweep half): last candle pierces the prior swing range
+    sweep: int = 0
+    if swing_start >= 0:
+        if high[last] > swing_high and close[last] < swing_high:
+            sweep = -1
+        elif low[last] < swing_low and close[last] > swing_low:
+            sweep = 1
+
+    return c1, c2, c3, mom, sweep
+
+
+# Optional accelerator: JIT-compile the vote kernel when numba is present.
+if njit is not None:
+    _sign = njit(cache=True)(_sign)
+    _condition_votes_jit = njit(cache=True)(_condition_votes_loop)
+    # Compile (or load from cache) at import, not on the first live scan.
+    # Candle columns are read-only and derived arrays (OFI, bin edges) are
+    # not; numba types the two separately, so warm the live mix of both.
+    _warm: np.ndarray = np.ones(30, dtype=np.float64)
+    _warm_ro: np.ndarray = _warm.copy()
+    _warm_ro.setflags(write=False)
+    _condition_votes_jit(_warm, _warm_ro, _warm_ro, _warm_ro, _warm_ro, 1, 2, 1, 20)
+    _vol_profile_jit(_warm_ro, _warm_ro, np.linspace(0.0, 2.0, VP_BINS + 1))
+    del _warm, _warm_ro
+else:
+    _condition_votes_jit = None
+
+
+def _condition_votes(cache: _ScoringCache) -> tuple[int, int, int, int, int]:
+    """Returns ``(ofi, cvd, vwap, momentum, sweep)`` votes, via numba when available.
+
+    Args:
+        cache: Column arrays of the scored window.
+
+    Returns:
+        Five ints in ``{-1, 0, +1}``. ``momentum`` is the raw ROC sign that
+        :func:`_score_momentum_and_orderbook` combines with the book, and
+        ``sweep`` is the half of Condition 5 that overrides the HVN check.
+    """
+    if _condition_votes_jit is not None:
+        return _condition_votes_jit(
+            cache.ofi, cache.high, cache.low, cache.close, cache.volume,
+            OFI_WINDOW, CVD_WINDOW, MOMENTUM_ROC_PERIOD, _SWEEP_LOOKBACK,
+        )
+    return (
+        _score_ofi(cache.ofi),
+        _score_cvd_trend(cache.ofi),
+        _score_vwap(cache),
+        _momentum_sign(cache.close),
+        _sweep_sign(cache.high, cache.low, cache.close, _SWEEP_LOOKBACK)
+        if cache.close.size > _SWEEP_LOOKBACK
+        else 0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public: Aggregate Scorer
 # ---------------------------------------------------------------------------
 
 def compute_score(
-    df: pd.DataFrame,
-    orderbook: Optional[dict] = None,
+    df: pd.DataFrame | Candles,
+    orderbook: Optional[OrderBook | dict] = None,
     symbol: str = "",
 ) -> int:
     """Computes the aggregate directional score for a single symbol.
@@ -382,9 +677,11 @@ def compute_score(
 
     Args:
         df: Clean OHLCV DataFrame indexed by UTC timestamp with columns:
-            ``[open, high, low, close, volume, taker_buy_volume, taker_sell_volume]``.
+            ``[open, high, low, close, volume, taker_buy_volume, taker_sell_volume]``,
+            or the equivalent ``Candles`` arrays (used as-is, with no conversion).
             Minimum of 30 rows required for reliable calculations.
-        orderbook: Optional L2 orderbook dict with keys ``"bids"`` and ``"asks"``.
+        orderbook: Optional L2 snapshot from ``fetch_orderbook``; a ccxt-style
+            dict with keys ``"bids"`` and ``"asks"`` is also accepted.
             If ``None``, Condition 4's orderbook sub-component scores 0.
 
     Returns:
@@ -396,25 +693,34 @@ def compute_score(
         >>> if score >= 4:
         ...     direction = "LONG"
     """
-    if df is None or df.empty or len(df) < 30:
-        logger.warning("Scoring skipped: DataFrame has %d rows (need ≥30).",
-                       len(df) if df is not None else 0)
+    if df is None:
+        logger.warning("Scoring skipped: DataFrame has 0 rows (need ≥30).")
+        return 0
+    candles: Candles = df if isinstance(df, Candles) else Candles.from_frame(df)
+    if candles.size < 30:
+        logger.warning("Scoring skipped: DataFrame has %d rows (need ≥30).", candles.size)
         return 0
 
-    ob: dict = orderbook if orderbook is not None else {}
+    ob: Optional[OrderBook] = (
+        OrderBook.from_levels(orderbook.get("bids") or [], orderbook.get("asks") or [])
+        if isinstance(orderbook, dict)
+        else orderbook
+    )
 
-    c1 = _score_ofi(df)
-    c2 = _score_cvd_trend(df)
-    c3 = _score_vwap(df)
-    c4 = _score_momentum_and_orderbook(df, ob)
-    c5 = _score_liquidity_zones(df)
+    cache: _ScoringCache = _build_scoring_cache(candles)
+
+    c1, c2, c3, momentum, sweep = _condition_votes(cache)
+    c4 = _score_momentum_and_orderbook(momentum, ob)
+    c5 = _score_liquidity_zones(cache, sweep, symbol)
 
     total: int = c1 + c2 + c3 + c4 + c5
 
-    _tag: str = f"[{symbol.split('/')[0]}] " if symbol else ""
-    logger.info(
-        "%sScore → OFI=%+d | CVD=%+d | VWAP=%+d | Momentum=%+d | Liquidity=%+d | TOTAL=%+d",
-        _tag, c1, c2, c3, c4, c5, total,
-    )
+    # The tag is built per call, so skip it (and the record) when INFO is off.
+    if logger.isEnabledFor(logging.INFO):
+        _tag: str = f"[{symbol.split('/')[0]}] " if symbol else ""
+        logger.info(
+            "%sScore → OFI=%+d | CVD=%+d | VWAP=%+d | Momentum=%+d | Liquidity=%+d | TOTAL=%+d",
+            _tag, c1, c2, c3, c4, c5, total,
+        )
 
     return total
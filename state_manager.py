@@ -21,7 +21,8 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
 
 from config import TRADING_PAIRS
 
@@ -45,11 +46,18 @@ class PairState(Enum):
     SHORT = auto()
 
 
+# Hot-path aliases: a module global plus an identity check skips the
+# enum-class attribute lookup that ``PairState.IDLE`` costs on every call.
+_IDLE: Final[PairState] = PairState.IDLE
+_LONG: Final[PairState] = PairState.LONG
+_SHORT: Final[PairState] = PairState.SHORT
+
+
 # ---------------------------------------------------------------------------
 # Data Classes
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VirtualPosition:
     """Immutable record of an open virtual (paper) position.
 
@@ -104,8 +112,10 @@ class StateManager:
         Args:
             pairs: List of ccxt-formatted trading symbols to track.
         """
-        self._states: dict[str, PairState] = {p: PairState.IDLE for p in pairs}
+        self._states: dict[str, PairState] = {p: _IDLE for p in pairs}
         self._positions: dict[str, Optional[VirtualPosition]] = {p: None for p in pairs}
+        # get_all_states() snapshot; dropped whenever a state changes.
+        self._all_states: Optional[Mapping[str, str]] = None
         logger.info("StateManager initialised for %d pairs: %s", len(pairs), pairs)
 
     # ------------------------------------------------------------------ #
@@ -121,7 +131,7 @@ class StateManager:
         Returns:
             The current ``PairState``. Defaults to ``IDLE`` for unknown symbols.
         """
-        return self._states.get(symbol, PairState.IDLE)
+        return self._states.get(symbol, _IDLE)
 
     def is_idle(self, symbol: str) -> bool:
         """Checks whether a pair is available for a new signal.
@@ -132,7 +142,7 @@ class StateManager:
         Returns:
             ``True`` if the pair has no open virtual position, else ``False``.
         """
-        return self._states.get(symbol) == PairState.IDLE
+        return self._states.get(symbol) is _IDLE
 
     def get_position(self, symbol: str) -> Optional[VirtualPosition]:
         """Returns the open virtual position for a symbol, if any.
@@ -145,15 +155,21 @@ class StateManager:
         """
         return self._positions.get(symbol)
 
-    def get_all_states(self) -> dict[str, str]:
+    def get_all_states(self) -> Mapping[str, str]:
         """Returns a human-readable summary of all pair states.
 
-        Useful for logging and monitoring dashboards.
+        Useful for logging and monitoring dashboards. The mapping is built
+        once per state change and shared between calls, so it is read-only;
+        an unchanged portfolio returns the identical object.
 
         Returns:
-            Dict mapping each symbol to its state name string.
+            Read-only mapping of each symbol to its state name string.
         """
-        return {sym: state.name for sym, state in self._states.items()}
+        if self._all_states is None:
+            self._all_states = MappingProxyType(
+                {sym: state.name for sym, state in self._states.items()}
+            )
+        return self._all_states
 
     # ------------------------------------------------------------------ #
     # Mutators                                                             #
@@ -194,8 +210,9 @@ class StateManager:
             )
             return False
 
-        new_state: PairState = PairState.LONG if direction == "LONG" else PairState.SHORT
+        new_state: PairState = _LONG if direction == "LONG" else _SHORT
         self._states[symbol] = new_state
+        self._all_states = None
         self._positions[symbol] = VirtualPosition(
             symbol=symbol,
             direction=direction,
@@ -220,9 +237,10 @@ class StateManager:
             reason: Human-readable reason logged alongside the state change
                     (e.g., ``"TP_HIT"``, ``"SL_HIT"``, ``"manual"``).
         """
-        prev: PairState = self._states.get(symbol, PairState.IDLE)
-        self._states[symbol] = PairState.IDLE
+        prev: PairState = self._states.get(symbol, _IDLE)
+        self._states[symbol] = _IDLE
         self._positions[symbol] = None
+        self._all_states = None
 
         logger.info(
             "UNLOCKED → [%s] (was %s). Reason: %s", symbol, prev.name, reason
@@ -231,9 +249,10 @@ class StateManager:
     def update_virtual_positions(self, current_prices: dict[str, float]) -> None:
         """Evaluates all open virtual positions against the latest prices.
 
-        Iterates over every locked pair and checks whether the current market
-        price has breached the TP or SL level. If a level is hit, the pair is
-        automatically unlocked and returned to IDLE.
+        Checks every priced pair that holds an open position against its TP
+        and SL levels. If a level is hit, the pair is automatically unlocked
+        and returned to IDLE. Work is proportional to ``current_prices``, not
+        to the number of tracked pairs — the scanner passes one price per call.
 
         This method should be called once per scan cycle *before* any new
         signal scoring to ensure the position state is current.
@@ -242,12 +261,9 @@ class StateManager:
             current_prices: Mapping of ccxt symbol → current market price.
                             Pairs absent from this dict are silently skipped.
         """
-        for symbol, position in list(self._positions.items()):
-            if position is None:
-                continue
-
-            price: Optional[float] = current_prices.get(symbol)
-            if price is None:
+        for symbol, price in current_prices.items():
+            position: Optional[VirtualPosition] = self._positions.get(symbol)
+            if position is None or price is None:
                 continue
 
             if position.direction == "LONG":
@@ -0,0 +1,48 @@
+"""
+Volume Profile Helpers for Neko Signal System.
+
+Shared by the scoring engine (Condition 5) and the risk manager (HVN
+targets), so both classify High Volume Nodes with the same threshold.
+
+A profile always has ``VP_BINS`` entries, which fixes the two order
+statistics behind ``np.percentile``'s linear interpolation and the weight
+between them. They are resolved once at import; each call is then a
+single partial partition instead of ``np.percentile``'s sort and set-up.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+import numpy as np
+
+from config import HVN_PERCENTILE, VP_BINS
+
+# Same rank as NumPy's "linear" method: (n - 1) * q. Written any other way
+# (e.g. n*q - q) the float can land an ulp past an integer rank and shift
+# the threshold onto the next order statistic.
+_HVN_Q: Final[float] = HVN_PERCENTILE / 100.0
+_HVN_VIRTUAL_INDEX: Final[float] = (VP_BINS - 1) * _HVN_Q
+_HVN_LO: Final[int] = min(max(int(np.floor(_HVN_VIRTUAL_INDEX)), 0), VP_BINS - 1)
+_HVN_HI: Final[int] = min(_HVN_LO + 1, VP_BINS - 1)
+_HVN_GAMMA: Final[float] = _HVN_VIRTUAL_INDEX - _HVN_LO if _HVN_LO < VP_BINS - 1 else 0.0
+
+
+def hvn_threshold(vol_bins: np.ndarray) -> float:
+    """``np.percentile(vol_bins, HVN_PERCENTILE)`` via one partial partition.
+
+    Uses the precomputed neighbour ranks and NumPy's own lerp formula, so
+    the result is bit-identical to ``np.percentile`` without a full sort.
+
+    Args:
+        vol_bins: Non-empty profile of exactly ``VP_BINS`` bin volumes.
+
+    Returns:
+        The ``HVN_PERCENTILE``-th percentile of ``vol_bins``.
+    """
+    part: np.ndarray = np.partition(vol_bins, (_HVN_LO, _HVN_HI))
+    lo: float = float(part[_HVN_LO])
+    diff: float = float(part[_HVN_HI]) - lo
+    if _HVN_GAMMA >= 0.5:
+        return float(part[_HVN_HI]) - diff * (1.0 - _HVN_GAMMA)
+    return lo + diff * _HVN_GAMMA